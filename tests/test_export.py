@@ -0,0 +1,198 @@
+"""
+Test Cases untuk Export Module
+Behavior test untuk file yang dihasilkan DiagnosisExporter
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import msgpack
+import pytest
+
+from utils.export import DiagnosisExporter
+
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+SAMPLE_DIAGNOSIS = {
+    'session_id': 'TEST_20250101_120000',
+    'diagnoses': [
+        {
+            'name': 'Kerusakan Touchscreen Digitizer',
+            'type': 'hardware',
+            'confidence': 0.88,
+            'confidence_category': 'Yakin',
+            'description': 'Touchscreen tidak berfungsi sementara tampilan normal',
+            'causes': ['Kerusakan komponen digitizer'],
+            'solutions': [
+                {'step': 1, 'action': 'Restart smartphone', 'detail': 'Coba restart dulu'}
+            ],
+            'estimated_cost': '200000-500000',
+            'repair_difficulty': 'medium'
+        }
+    ]
+}
+
+SAMPLE_SYMPTOMS = ['touchscreen_tidak_respons', 'layar_tampil_normal']
+
+SAMPLE_REASONING = [
+    {
+        'type': 'rule_fired',
+        'rule_id': 'R6',
+        'conditions': ['touchscreen_tidak_respons', 'layar_tampil_normal'],
+        'conclusion': 'kerusakan_touchscreen_digitizer',
+        'cf': 0.88
+    }
+]
+
+
+SAMPLE_REPORT = {
+    'diagnosis_data': SAMPLE_DIAGNOSIS,
+    'symptoms': SAMPLE_SYMPTOMS,
+    'reasoning_trace': SAMPLE_REASONING
+}
+
+
+def _assert_pdf(path: str):
+    """File ada dan berupa PDF lengkap"""
+    data = Path(path).read_bytes()
+    assert data.startswith(b'%PDF-')
+    assert data.rstrip().endswith(b'%%EOF')
+
+
+def test_export_to_pdf_concurrent(tmp_path):
+    """Export PDF dari banyak thread sekaligus (satu thread per sesi Streamlit)"""
+    exporter = DiagnosisExporter(str(tmp_path))
+    errors = []
+
+    def worker(n: int):
+        try:
+            for i in range(10):
+                path = exporter.export_to_pdf(SAMPLE_DIAGNOSIS, SAMPLE_SYMPTOMS,
+                                              SAMPLE_REASONING, f'report_{n}_{i}.pdf', NOW)
+                _assert_pdf(path)
+        except Exception as e:  # dikumpulkan, assert di thread utama
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(list(tmp_path.glob('report_*.pdf'))) == 80
+
+
+
+def test_export_to_json_large_int(tmp_path):
+    """Integer di luar 64-bit tetap bisa di-export (seperti json.dump)"""
+    exporter = DiagnosisExporter(str(tmp_path))
+
+    path = exporter.export_to_json({'n': 2 ** 70}, 'big.json', NOW)
+    lines = exporter.export_many_to_json([{'n': 2 ** 70}], 'big.jsonl', NOW)
+
+    assert json.loads(Path(path).read_bytes())['data'] == {'n': 2 ** 70}
+    assert json.loads(Path(lines).read_bytes()) == {'n': 2 ** 70}
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview])
+def test_export_to_json_preserialized(tmp_path, wrap):
+    """JSON yang sudah di-serialize disisipkan apa adanya ke envelope export"""
+    exporter = DiagnosisExporter(str(tmp_path))
+    raw = json.dumps(SAMPLE_DIAGNOSIS).encode('utf-8')
+
+    spliced = exporter.export_to_json(wrap(raw), 'spliced.json', NOW)
+    regular = exporter.export_to_json(SAMPLE_DIAGNOSIS, 'regular.json', NOW)
+
+    content = Path(spliced).read_bytes()
+    assert raw in content
+    assert json.loads(content) == json.loads(Path(regular).read_bytes())
+
+def test_export_many_to_json(tmp_path):
+    """Satu baris JSON per diagnosis, urutan dipertahankan"""
+    exporter = DiagnosisExporter(str(tmp_path))
+    diagnoses = [SAMPLE_DIAGNOSIS, {'session_id': 'S2', 'diagnoses': []}]
+
+    path = exporter.export_many_to_json(diagnoses, now=NOW)
+
+    assert Path(path).name == 'diagnosis_batch_20250101_120000.jsonl'
+    lines = Path(path).read_bytes().splitlines()
+    assert [json.loads(line) for line in lines] == diagnoses
+
+
+def test_export_many_to_pdf(tmp_path):
+    """Banyak laporan dalam satu PDF, satu laporan per halaman atau lebih"""
+    exporter = DiagnosisExporter(str(tmp_path))
+
+    single = exporter.export_to_pdf(SAMPLE_DIAGNOSIS, SAMPLE_SYMPTOMS,
+                                    SAMPLE_REASONING, 'single.pdf', NOW)
+    many = exporter.export_many_to_pdf([SAMPLE_REPORT] * 3, now=NOW)
+
+    assert Path(many).name == 'diagnosis_batch_20250101_120000.pdf'
+    _assert_pdf(many)
+    single_pages = Path(single).read_bytes().count(b'/Type /Page\n')
+    assert Path(many).read_bytes().count(b'/Type /Page\n') == 3 * single_pages
+
+
+def test_export_many_to_pdf_parallel(tmp_path):
+    """Satu PDF per laporan, path urut sesuai input"""
+    exporter = DiagnosisExporter(str(tmp_path))
+
+    paths = exporter.export_many_to_pdf_parallel([SAMPLE_REPORT] * 3, workers=2, now=NOW)
+
+    assert [Path(p).name for p in paths] == [
+        f'diagnosis_20250101_120000_{i:03d}.pdf' for i in (1, 2, 3)
+    ]
+    for path in paths:
+        _assert_pdf(path)
+
+
+def test_aexport_to_json(tmp_path):
+    """Versi async menulis file yang sama dengan export_to_json"""
+    exporter = DiagnosisExporter(str(tmp_path))
+
+    sync_path = exporter.export_to_json(SAMPLE_DIAGNOSIS, 'sync.json', NOW)
+    async_path = asyncio.run(exporter.aexport_to_json(SAMPLE_DIAGNOSIS, 'async.json', NOW))
+
+    assert Path(async_path).read_bytes() == Path(sync_path).read_bytes()
+    data = json.loads(Path(async_path).read_bytes())
+    assert data['export_date'] == '2025-01-01T12:00:00'
+    assert data['data'] == SAMPLE_DIAGNOSIS
+
+
+
+def test_aexport_to_json_aiofiles(tmp_path, monkeypatch):
+    """Jalur aiofiles menghasilkan file yang sama dengan jalur thread pool"""
+    pytest.importorskip('aiofiles')
+    import utils.export as export_module
+    exporter = DiagnosisExporter(str(tmp_path))
+
+    with_aiofiles = asyncio.run(exporter.aexport_to_json(SAMPLE_DIAGNOSIS, 'aiofiles.json', NOW))
+    monkeypatch.setattr(export_module, 'aiofiles', None)
+    with_thread = asyncio.run(exporter.aexport_to_json(SAMPLE_DIAGNOSIS, 'thread.json', NOW))
+
+    assert Path(with_aiofiles).read_bytes() == Path(with_thread).read_bytes()
+
+def test_export_history_msgpack(tmp_path):
+    """Riwayat msgpack berisi data yang sama dengan format json"""
+    exporter = DiagnosisExporter(str(tmp_path))
+    history = [
+        {'timestamp': '2025-01-01T12:00:00', 'symptoms_count': 2,
+         'top_diagnosis': 'Kerusakan Touchscreen Digitizer', 'confidence': 0.88}
+    ]
+
+    path = exporter.export_history(history, format='msgpack', now=NOW)
+
+    assert Path(path).name == 'history_20250101_120000.msgpack'
+    data = msgpack.unpackb(Path(path).read_bytes(), raw=False)
+    assert data == {
+        'export_date': '2025-01-01T12:00:00',
+        'total_entries': 1,
+        'history': history
+    }
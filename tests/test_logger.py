@@ -0,0 +1,122 @@
+"""
+Test Cases untuk Logger Module
+Behavior test untuk file session yang ditulis SmartphoneExpertLogger
+"""
+
+import json
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.logger import SmartphoneExpertLogger
+
+
+def _make_logger(tmp_path, name: str) -> SmartphoneExpertLogger:
+    """Logger dengan nama unik per test (logging.getLogger bersifat global)"""
+    return SmartphoneExpertLogger(f'test_{name}', str(tmp_path))
+
+
+def test_save_session_returns_future(tmp_path):
+    """save_session berjalan di background dan menulis ringkasan + events"""
+    logger = _make_logger(tmp_path, 'save_session')
+    try:
+        logger.log_diagnosis_start(['layar_tidak_menyala'])
+        logger.log_rule_fired('R1', ['layar_tidak_menyala'], 'kerusakan_lcd')
+        logger.log_diagnosis_result('kerusakan_lcd', 0.8)
+
+        future = logger.save_session(include_events=True)
+
+        assert isinstance(future, Future)
+        assert future.result(timeout=10) is True
+        data = json.loads(Path(logger.session_log_file).read_bytes())
+        assert data['session_id'] == logger.session_id
+        assert data['total_events'] == len(data['events']) == len(logger.events)
+        assert [e['event_type'] for e in data['events']] == [e['event_type'] for e in logger.events]
+        assert data['event_types']['RULE_FIRED'] == 1
+    finally:
+        logger.close()
+
+
+def test_wait_for_flush(tmp_path):
+    """wait_for_flush kembali sesudah semua save yang di-submit selesai"""
+    logger = _make_logger(tmp_path, 'wait_for_flush')
+    try:
+        logger.log_user_action('mulai_diagnosis')
+        futures = [logger.save_session() for _ in range(3)]
+
+        logger.wait_for_flush()
+
+        assert all(f.done() and f.result() for f in futures)
+        data = json.loads(Path(logger.session_log_file).read_bytes())
+        assert data['total_events'] == len(logger.events)
+        assert 'events' not in data
+    finally:
+        logger.close()
+
+
+def test_close_is_idempotent(tmp_path):
+    """close() boleh dipanggil ulang; save sesudahnya ditulis langsung"""
+    logger = _make_logger(tmp_path, 'close')
+    logger.log_user_action('mulai_diagnosis')
+    pending = logger.save_session()
+
+    logger.close()
+    logger.close()
+
+    assert pending.done() and pending.result() is True
+    after = logger.save_session(include_events=True)
+    assert after.done() and after.result() is True
+    data = json.loads(Path(logger.session_log_file).read_bytes())
+    assert len(data['events']) == len(logger.events)
+
+
+def test_events_logged_after_close_are_saved(tmp_path):
+    """Event sesudah close() tetap masuk sidecar dan file session"""
+    logger = _make_logger(tmp_path, 'after_close')
+    logger.log_user_action('sebelum_close')
+    logger.close()
+
+    logger.log_user_action('sesudah_close')
+    logger.info('info sesudah close')
+
+    assert logger.save_session(include_events=True).result() is True
+    data = json.loads(Path(logger.session_log_file).read_bytes())
+    assert data['total_events'] == len(data['events']) == len(logger.events) == 5
+    assert data['events'][-1]['message'] == 'info sesudah close'
+
+
+def test_loggers_in_same_second_do_not_share_sidecar(tmp_path):
+    """Dua logger dengan waktu mulai yang sama tetap punya file session sendiri"""
+    first = _make_logger(tmp_path, 'sidecar_a')
+    second = _make_logger(tmp_path, 'sidecar_b')
+    try:
+        first.log_user_action('a')
+        second.log_user_action('b')
+        second.log_user_action('c')
+
+        assert first.session_events_file != second.session_events_file
+        for logger in (first, second):
+            assert logger.save_session(include_events=True).result(timeout=10)
+            data = json.loads(Path(logger.session_log_file).read_bytes())
+            assert data['total_events'] == len(data['events']) == len(logger.events)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_unencodable_event_data_does_not_raise(tmp_path):
+    """Data yang tidak bisa di-encode JSON tetap tercatat, pemanggil tidak error"""
+    logger = _make_logger(tmp_path, 'unencodable')
+    try:
+        logger.info('angka besar', n=2 ** 70)
+        logger.info('key tuple', mapping={(1, 2): 'x'})
+
+        assert logger.save_session(include_events=True).result(timeout=10)
+        data = json.loads(Path(logger.session_log_file).read_bytes())
+        events = [e for e in data['events'] if e['event_type'] == 'INFO']
+        assert events[0]['data'] == {'n': 2 ** 70}
+        assert events[1]['data'] == repr({'mapping': {(1, 2): 'x'}})
+        assert data['total_events'] == len(data['events']) == len(logger.events)
+    finally:
+        logger.close()
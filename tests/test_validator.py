@@ -0,0 +1,164 @@
+"""
+Test Cases untuk Validator Module
+Behavior test untuk InputValidator (pesan error, format ID, batch CF)
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+import utils.validator as validator
+from utils.validator import InputValidator
+
+
+def test_errors_created_lazily():
+    """errors tetap None sampai error pertama, reset kembali ke None"""
+    v = InputValidator()
+    assert v.errors is None
+    assert not v.has_errors()
+    assert v.get_errors() == []
+    assert v.get_error_messages() == []
+
+    assert not v.validate_cf(2.0)
+
+    assert v.has_errors()
+    assert v.errors[0].field == 'cf'
+    assert v.errors[0].message == 'CF harus antara 0.0 dan 1.0'
+    assert v.get_errors() == [{'field': 'cf', 'message': 'CF harus antara 0.0 dan 1.0'}]
+    assert v.get_error_messages() == ['cf: CF harus antara 0.0 dan 1.0']
+
+    v.reset_errors()
+    assert v.errors is None
+    assert not v.has_errors()
+
+
+def test_symptoms_list_aggregates_bad_ids():
+    """Semua symptom ID yang salah dilaporkan dalam satu error"""
+    v = InputValidator()
+    symptoms = ['layar_mati', 'Layar_Bergaris', 'baterai_cepat_habis', '1_port']
+
+    assert not v.validate_symptoms_list(symptoms)
+
+    assert v.get_errors() == [{
+        'field': 'symptom_id',
+        'message': "Symptom ID harus huruf kecil, angka, dan underscore: 'Layar_Bergaris', '1_port'"
+    }]
+    assert symptoms == ['layar_mati', 'Layar_Bergaris', 'baterai_cepat_habis', '1_port']
+
+
+def test_symptoms_list_duplicates_and_bounds():
+    """Duplikat dan batas jumlah default (1..15) menghasilkan satu error"""
+    v = InputValidator()
+    assert not v.validate_symptoms_list(['a', 'a'])
+    assert v.get_error_messages() == ['symptoms: Terdapat symptom duplikat']
+
+    v.reset_errors()
+    assert not v.validate_symptoms_list([])
+    assert v.get_error_messages() == ['symptoms: Minimal 1 symptom harus dipilih']
+
+    v.reset_errors()
+    assert not v.validate_symptoms_list([f's{i}' for i in range(16)])
+    assert v.get_error_messages() == ['symptoms: Maksimal 15 symptoms dapat dipilih']
+
+    v.reset_errors()
+    assert not v.validate_symptoms_list(['a', 'b', 'c'], min_count=4)
+    assert v.get_error_messages() == ['symptoms: Minimal 4 symptom harus dipilih']
+
+
+def test_knowledge_base_aggregates_bad_rule_ids():
+    """Rule ID yang salah dilaporkan sekaligus, rule non-dict ditolak"""
+    rule = {'IF': ['a'], 'THEN': 'b', 'CF': 0.8}
+    v = InputValidator()
+
+    assert v.validate_knowledge_base_rules({'rules': {'R1': rule, 'R2_lcd': rule}})
+    assert not v.validate_knowledge_base_rules({'rules': {'R1': rule, 'X1': rule, 'R': rule}})
+    assert v.get_error_messages() == [
+        "rule_id: Rule ID harus format R<angka> (contoh: R1, R10): 'X1', 'R'"
+    ]
+
+    v.reset_errors()
+    assert not v.validate_knowledge_base_rules({'rules': {'R1': 'oops'}})
+    assert v.get_error_messages() == ['rule: Rule harus berupa dictionary']
+
+
+@pytest.mark.parametrize('method, value', [
+    ('validate_symptom_id', 'layar_mati\n'),
+    ('validate_rule_id', 'R1\n'),
+    ('validate_session_id', 'session_1\n'),
+])
+def test_ids_reject_trailing_newline(method, value):
+    """ID dengan newline di akhir ditolak (bukan diterima seperti regex $)"""
+    v = InputValidator()
+    assert getattr(v, method)(value.rstrip('\n'))
+    assert not getattr(v, method)(value)
+    assert v.has_errors()
+
+
+def _cf_dict(size: int, **overrides) -> dict:
+    """CF dict valid dengan `size` entry, beberapa nilai bisa diganti"""
+    cf_dict = {f'gejala_{i}': 0.5 for i in range(size)}
+    cf_dict.update(overrides)
+    return cf_dict
+
+
+# Di sekitar _NUMPY_MIN_SIZE: 31 selalu lewat loop Python, 32 lewat numpy
+# jika terpasang
+_CF_SIZES = [validator._NUMPY_MIN_SIZE - 1, validator._NUMPY_MIN_SIZE]
+
+
+@pytest.mark.parametrize('size', _CF_SIZES)
+def test_cf_dict_range(size):
+    """Batas 0.0 dan 1.0 inklusif, di luar itu ditolak"""
+    v = InputValidator()
+    assert v.validate_cf_dict(_cf_dict(size, gejala_0=0.0, gejala_1=1, gejala_2=True))
+
+    assert not v.validate_cf_dict(_cf_dict(size, gejala_0=1.01))
+    assert v.get_error_messages() == ['cf: CF harus antara 0.0 dan 1.0']
+
+    v.reset_errors()
+    assert not v.validate_cf_dict(_cf_dict(size, gejala_0=-0.01))
+    assert v.get_error_messages() == ['cf: CF harus antara 0.0 dan 1.0']
+
+
+@pytest.mark.parametrize('size', _CF_SIZES)
+def test_cf_dict_overflow_int(size):
+    """Int di luar jangkauan float64 ditolak sebagai di luar range, bukan crash"""
+    v = InputValidator()
+    assert not v.validate_cf_dict(_cf_dict(size, gejala_0=10 ** 400))
+    assert v.get_error_messages() == ['cf: CF harus antara 0.0 dan 1.0']
+
+
+@pytest.mark.parametrize('size', _CF_SIZES)
+def test_cf_dict_types_and_keys(size):
+    """String numerik ditolak walaupun bisa dikonversi numpy; key salah diagregasi"""
+    v = InputValidator()
+    assert not v.validate_cf_dict(_cf_dict(size, gejala_0='0.5'))
+    assert v.get_error_messages() == ['cf: CF harus berupa angka']
+
+    v.reset_errors()
+    assert not v.validate_cf_dict(_cf_dict(size, Bad=0.5, **{'x y': 0.5}))
+    assert v.get_error_messages() == [
+        "symptom_id: Symptom ID harus huruf kecil, angka, dan underscore: 'Bad', 'x y'"
+    ]
+
+
+def test_cf_dict_numpy_threshold(monkeypatch):
+    """numpy hanya dipakai mulai _NUMPY_MIN_SIZE entry"""
+    np = pytest.importorskip('numpy')
+    calls = []
+    fromiter = np.fromiter
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs.get('count'))
+        return fromiter(*args, **kwargs)
+
+    monkeypatch.setattr(validator, 'np', np)
+    monkeypatch.setattr(np, 'fromiter', spy)
+    v = InputValidator()
+
+    assert v.validate_cf_dict(_cf_dict(_CF_SIZES[0]))
+    assert calls == []
+    assert v.validate_cf_dict(_cf_dict(_CF_SIZES[1]))
+    assert calls == [_CF_SIZES[1]]
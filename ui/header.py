@@ -88,8 +88,12 @@ def render_features():
     """, unsafe_allow_html=True)
 
 
+_SECTION_HEADER_TMPL = '<h2 class="section-header">{title}</h2>'
+_SECTION_SUBTITLE_TMPL = '<p class="section-subtitle">{subtitle}</p>'
+
+
 def render_section_header(title: str, subtitle: str = ""):
     """Render section header"""
-    st.markdown(f'<h2 class="section-header">{title}</h2>', unsafe_allow_html=True)
+    st.markdown(_SECTION_HEADER_TMPL.format(title=title), unsafe_allow_html=True)
     if subtitle:
-        st.markdown(f'<p class="section-subtitle">{subtitle}</p>', unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(_SECTION_SUBTITLE_TMPL.format(subtitle=subtitle), unsafe_allow_html=True)
\ No newline at end of file
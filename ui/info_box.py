@@ -3,51 +3,62 @@ Professional Info Box Components
 """
 
 import streamlit as st
+from functools import lru_cache
+from typing import Dict, Final, Optional, Tuple
 
 
-def render_info_box(title: str, content: str, icon: str = "ℹ️"):
-    """Render professional info box"""
-    st.markdown(f"""
-    <div class="info-box">
-        <h4>{icon} {title}</h4>
+# variant -> (extra CSS class, default icon, heading tag)
+_VARIANT: Final[Dict[str, Tuple[str, str, str]]] = {
+    "info": ("", "ℹ️", "h4"),
+    "success": (" success-box", "✅", "h3"),
+    "warning": (" warning-box", "⚠️", "h3"),
+    "danger": (" danger-box", "🚨", "h3"),
+}
+
+_BOX_TEMPLATE: Final[str] = """
+    <div class="info-box{cls}">
+        <{h}>{icon} {title}</{h}>
         {content}
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+@lru_cache(maxsize=256)
+def _box_html(title: str, content: str, icon: Optional[str] = None, variant: str = "info") -> str:
+    """Build HTML for a box variant"""
+    cls, default_icon, h = _VARIANT[variant]
+    if icon is None:
+        icon = default_icon
+    return _BOX_TEMPLATE.format(cls=cls, h=h, icon=icon, title=title, content=content)
+
+
+def _render_box(title: str, content: str, icon: Optional[str] = None, variant: str = "info"):
+    """Render box variant"""
+    st.markdown(_box_html(title, content, icon, variant), unsafe_allow_html=True)
+
+
+def render_info_box(title: str, content: str, icon: str = "ℹ️"):
+    """Render professional info box"""
+    _render_box(title, content, icon, "info")
 
 
 def render_success_box(title: str, content: str, icon: str = "✅"):
     """Render success box"""
-    st.markdown(f"""
-    <div class="info-box success-box">
-        <h3>{icon} {title}</h3>
-        {content}
-    </div>
-    """, unsafe_allow_html=True)
+    _render_box(title, content, icon, "success")
 
 
 def render_warning_box(title: str, content: str, icon: str = "⚠️"):
     """Render warning box"""
-    st.markdown(f"""
-    <div class="info-box warning-box">
-        <h3>{icon} {title}</h3>
-        {content}
-    </div>
-    """, unsafe_allow_html=True)
+    _render_box(title, content, icon, "warning")
 
 
 def render_danger_box(title: str, content: str, icon: str = "🚨"):
     """Render danger box"""
-    st.markdown(f"""
-    <div class="info-box danger-box">
-        <h3>{icon} {title}</h3>
-        {content}
-    </div>
-    """, unsafe_allow_html=True)
+    _render_box(title, content, icon, "danger")
 
 
-def render_instructions():
-    """Render diagnosis instructions"""
-    content = """
+# Static pages: content is fixed, so build the HTML once at import time
+_INSTRUCTIONS_CONTENT: Final[str] = """
     <ol>
         <li><strong>Pilih gejala</strong> yang dialami smartphone Anda dari kategori di bawah</li>
         <li><strong>Tentukan tingkat keyakinan</strong> Anda terhadap setiap gejala (0-100%)</li>
@@ -59,12 +70,10 @@ def render_instructions():
         semakin presisi diagnosis yang diberikan sistem!
     </div>
     """
-    render_info_box("📋 Petunjuk Penggunaan", content)
 
+_INSTRUCTIONS_HTML: Final[str] = _box_html("📋 Petunjuk Penggunaan", _INSTRUCTIONS_CONTENT)
 
-def render_welcome_message():
-    """Render welcome message on home page"""
-    content = """
+_WELCOME_CONTENT: Final[str] = """
     <p style="font-size: 1.05rem; line-height: 1.8; color: #374151; margin-bottom: 1rem;">
         Selamat datang di <strong>Smartphone Expert System</strong>, sistem pakar berbasis 
         <em>rule-based reasoning</em> yang dirancang untuk membantu Anda mengidentifikasi 
@@ -89,4 +98,15 @@ def render_welcome_message():
         </p>
     </div>
     """
-    render_info_box("👋 Selamat Datang!", content, icon="")
\ No newline at end of file
+
+_WELCOME_HTML: Final[str] = _box_html("👋 Selamat Datang!", _WELCOME_CONTENT, icon="")
+
+
+def render_instructions():
+    """Render diagnosis instructions"""
+    st.markdown(_INSTRUCTIONS_HTML, unsafe_allow_html=True)
+
+
+def render_welcome_message():
+    """Render welcome message on home page"""
+    st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
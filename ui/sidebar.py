@@ -4,21 +4,14 @@ Professional Sidebar Component
 
 import streamlit as st
 import os
+import textwrap
 from pathlib import Path
+from typing import Final, Optional
 
 
-def render_sidebar():
-    """Render professional sidebar"""
-    
-    with st.sidebar:
-        # Logo Section
-        logo_path = Path("assets/logo (2).jpg")
-        
-        if logo_path.exists():
-            st.image(str(logo_path), use_container_width=True)
-        else:
-            # Fallback gradient logo
-            st.markdown("""
+_LOGO_PATH: Final[Path] = Path("assets/logo (2).jpg")
+
+_FALLBACK_LOGO_HTML = """
             <div style="
                 background: linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%);
                 padding: 3rem 2rem;
@@ -32,39 +25,27 @@ def render_sidebar():
                 <div style="font-size: 1.1rem; font-weight: 600;">Smartphone</div>
                 <div style="font-size: 0.9rem; opacity: 0.9;">Expert System</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # Navigation Header
-        st.markdown("### 🧭 NAVIGASI")
-        
-        # Navigation Radio
-        page = st.radio(
-            "Pilih Halaman:",
-            ["🏠 Home", "🔍 Diagnosis", "📜 Riwayat", "ℹ️ Tentang"],
-            label_visibility="collapsed"
-        )
-        
-        # Divider
-        st.markdown("<hr style='margin: 1.5rem 0; border-color: #374151;'>", 
-                   unsafe_allow_html=True)
-        
-        # Statistics Section
-        st.markdown("### 📊 STATISTIK")
-        
-        total_diagnosis = len(st.session_state.get('diagnosis_history', []))
-        
-        st.metric(
-            label="Total Diagnosis",
-            value=total_diagnosis,
-            delta="+1 Hari Ini" if total_diagnosis > 0 else None
-        )
-        
-        # Divider
-        st.markdown("<hr style='margin: 1.5rem 0; border-color: #374151;'>", 
-                   unsafe_allow_html=True)
-        
-        # Info Section
-        st.markdown("""
+            """
+
+_FOOTER_HTML = """
+    <div style="
+        margin-top: 2rem;
+        padding-top: 1rem;
+        border-top: 1px solid #374151;
+        text-align: center;
+        font-size: 0.75rem;
+        color: #6b7280;
+    ">
+        <p>Developed with ❤️</p>
+        <p>Version 1.0.0</p>
+    </div>
+    """
+
+_DIVIDER_HTML = "<hr style='margin: 1.5rem 0; border-color: #374151;'>"
+
+_NAV_HEADER_MD = "### 🧭 NAVIGASI"
+
+_INFO_HTML = """
         <div style="
             text-align: center;
             color: #9ca3af;
@@ -81,27 +62,78 @@ def render_sidebar():
                 © 2025 Smartphone Expert System
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+# Contiguous static blocks are joined so each is sent as one element.
+# Pieces are dedented first: indented HTML after a blank line would
+# otherwise be parsed as a markdown code block.
+_FALLBACK_NAV_HTML = textwrap.dedent(_FALLBACK_LOGO_HTML).strip() + "\n\n" + _NAV_HEADER_MD
+
+_STATS_HEADER_MD = _DIVIDER_HTML + "\n\n### 📊 STATISTIK"
+
+_SIDEBAR_INFO_HTML = "\n\n".join(
+    (_DIVIDER_HTML, textwrap.dedent(_INFO_HTML).strip(), _DIVIDER_HTML)
+)
+
+
+@st.cache_resource
+def _load_logo() -> Optional[bytes]:
+    """Load logo bytes once per process (None jika file tidak ada)"""
+    return _LOGO_PATH.read_bytes() if _LOGO_PATH.is_file() else None
+
+
+def _stats_metric_args() -> dict:
+    """
+    Argumen st.metric untuk statistik, disimpan di session_state
+    dan hanya dihitung ulang jika jumlah riwayat berubah
+    """
+    total_diagnosis = len(st.session_state.get('diagnosis_history', []))
+    
+    if st.session_state.get('_sidebar_key') != total_diagnosis:
+        st.session_state['_sidebar_key'] = total_diagnosis
+        st.session_state['_sidebar_metric'] = {
+            'label': "Total Diagnosis",
+            'value': total_diagnosis,
+            'delta': "+1 Hari Ini" if total_diagnosis > 0 else None
+        }
+    
+    return st.session_state['_sidebar_metric']
+
+
+def render_sidebar():
+    """Render professional sidebar"""
+    
+    with st.sidebar:
+        # Logo Section
+        logo = _load_logo()
+        
+        if logo:
+            st.image(logo, use_container_width=True)
+            
+            # Navigation Header
+            st.markdown(_NAV_HEADER_MD)
+        else:
+            # Fallback gradient logo + Navigation Header
+            st.markdown(_FALLBACK_NAV_HTML, unsafe_allow_html=True)
+        
+        # Navigation Radio
+        page = st.radio(
+            "Pilih Halaman:",
+            ["🏠 Home", "🔍 Diagnosis", "📜 Riwayat", "ℹ️ Tentang"],
+            label_visibility="collapsed"
+        )
+        
+        # Divider + Statistics Header
+        st.markdown(_STATS_HEADER_MD, unsafe_allow_html=True)
+        
+        st.metric(**_stats_metric_args())
         
-        # Quick Actions (if needed)
-        st.markdown("<hr style='margin: 1.5rem 0; border-color: #374151;'>", 
-                   unsafe_allow_html=True)
+        # Divider + Info Section (single static block)
+        st.markdown(_SIDEBAR_INFO_HTML, unsafe_allow_html=True)
     
     return page
 
 
 def render_sidebar_footer():
     """Render sidebar footer"""
-    st.sidebar.markdown("""
-    <div style="
-        margin-top: 2rem;
-        padding-top: 1rem;
-        border-top: 1px solid #374151;
-        text-align: center;
-        font-size: 0.75rem;
-        color: #6b7280;
-    ">
-        <p>Developed with ❤️</p>
-        <p>Version 1.0.0</p>
-    </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    st.sidebar.markdown(_FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file
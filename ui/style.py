@@ -3,9 +3,16 @@ Professional UI Styles
 Clean, Modern, and Enterprise-grade Design
 """
 
-def get_custom_css():
-    """Return professional CSS styling"""
-    return """
+import hashlib
+import re
+from pathlib import Path
+from typing import Optional
+
+# Streamlit serves files in <app root>/static at ./app/static/
+# (requires server.enableStaticServing)
+_STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+
+_STYLE_BLOCK = """
     <style>
         /* Import Professional Font */
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
@@ -442,4 +449,54 @@ def get_custom_css():
             }
         }
     </style>
-    """
\ No newline at end of file
+    """
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+_CSS_MIN = _minify_css(_STYLE_BLOCK.split('<style>', 1)[1].rsplit('</style>', 1)[0])
+
+_css_link: Optional[str] = None
+
+
+def _static_serving_enabled() -> bool:
+    """Check apakah Streamlit static file serving aktif"""
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _write_static_css() -> Optional[str]:
+    """Write minified CSS ke static dir, return link tag (None jika gagal)"""
+    if not _static_serving_enabled():
+        return None
+    
+    digest = hashlib.sha1(_CSS_MIN.encode('utf-8')).hexdigest()[:8]
+    filename = f'app.{digest}.css'
+    
+    try:
+        _STATIC_DIR.mkdir(parents=True, exist_ok=True)
+        css_path = _STATIC_DIR / filename
+        if not css_path.exists():
+            css_path.write_text(_CSS_MIN, encoding='utf-8')
+    except OSError:
+        return None
+    
+    return f'<link rel="stylesheet" href="./app/static/{filename}">'
+
+
+def get_custom_css():
+    """Return professional CSS styling"""
+    global _css_link
+    if _css_link is None:
+        # Content-hashed filename: browser can cache it across reruns
+        _css_link = _write_static_css() or _STYLE_BLOCK
+    return _css_link
@@ -3,47 +3,123 @@ Export Module
 Export hasil diagnosis ke berbagai format (PDF, JSON, CSV)
 """
 
-from fpdf import FPDF
+import asyncio
+import io
 import json
-import csv
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Union
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback ke stdlib json
+    orjson = None
 
-class DiagnosisPDFExporter(FPDF):
-    """Custom PDF class untuk laporan diagnosis"""
+try:
+    import aiofiles
+except ImportError:  # pragma: no cover - fallback ke thread pool
+    aiofiles = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - format msgpack tidak tersedia
+    msgpack = None
+
+
+# Buffer besar: satu export = sedikit write() syscall
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# Kolom CSV tetap, jadi header dan template baris dibuat sekali
+_DIAGNOSIS_CSV_HEADER = 'rank,diagnosis,type,confidence,description,estimated_cost,repair_difficulty\r\n'
+_DIAGNOSIS_CSV_ROW = '{},{},{},{:.1f}%,{},{},{}\r\n'
+_HISTORY_CSV_HEADER = 'timestamp,symptoms_count,top_diagnosis,confidence\r\n'
+_HISTORY_CSV_ROW = '{},{},{},{}\r\n'
+
+
+@lru_cache(maxsize=None)
+def _pdf():
+    """Import modul PDF (reportlab) saat pertama kali dibutuhkan"""
+    try:
+        from . import pdf_report
+    except ImportError:  # dijalankan langsung sebagai script
+        import pdf_report
+    return pdf_report
+
+
+def _file_timestamp(now: datetime) -> str:
+    """Timestamp untuk nama file (YYYYmmdd_HHMMSS) tanpa strftime"""
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+
+
+def _iso_timestamp(now: datetime) -> str:
+    """Timestamp ISO 8601 presisi detik (tanpa mikrodetik) untuk metadata export"""
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d}T{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data ke JSON (indent 2, UTF-8)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (subclass TypeError): mis. int di luar
+            # 64-bit; stdlib json masih bisa meng-encode
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dump_json_line(data: Any) -> bytes:
+    """Serialize data ke satu baris JSON Lines"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # fallback ke stdlib json, lihat _dump_json
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def _write_file(path: str, data) -> None:
+    """Tulis seluruh data ke file dengan satu os.write (hint akses sekuensial)"""
+    flags = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+             | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0))
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if hasattr(os, 'posix_fadvise'):
+            # Laporan jarang dibaca ulang oleh proses ini: jangan penuhi page cache
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _csv_field(value: Any) -> str:
+    """Quote field CSV hanya jika perlu (sama dengan csv.QUOTE_MINIMAL)"""
+    value = str(value)
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _history_csv_bytes(history: List[Dict]) -> bytes:
+    """
+    Render riwayat ke CSV (termasuk header) sebagai satu buffer
+    
+    Riwayat dipecah dulu menjadi kolom (satu list per field), lalu
+    semua baris diformat dan di-encode sekaligus.
+    """
+    top_diags = [(entry.get('diagnoses') or [{}])[0] for entry in history]
+    timestamps = [_csv_field(entry.get('timestamp', 'Unknown')) for entry in history]
+    symptom_counts = [len(entry.get('symptoms', [])) for entry in history]
+    top_names = [_csv_field(top.get('diagnosis', 'Unknown')) for top in top_diags]
+    confidences = [f"{top.get('cf', 0)*100:.1f}%" if top else 'N/A' for top in top_diags]
     
-    def __init__(self):
-        super().__init__()
-        self.set_auto_page_break(auto=True, margin=15)
-        
-    def header(self):
-        """Header untuk setiap halaman"""
-        self.set_font('Arial', 'B', 16)
-        self.cell(0, 10, 'Laporan Diagnosis Smartphone', 0, 1, 'C')
-        self.set_font('Arial', 'I', 10)
-        self.cell(0, 5, 'Sistem Pakar Identifikasi Kerusakan', 0, 1, 'C')
-        self.ln(5)
-        
-    def footer(self):
-        """Footer untuk setiap halaman"""
-        self.set_y(-15)
-        self.set_font('Arial', 'I', 8)
-        self.cell(0, 10, f'Halaman {self.page_no()}', 0, 0, 'C')
-        
-    def chapter_title(self, title: str):
-        """Judul chapter"""
-        self.set_font('Arial', 'B', 14)
-        self.set_fill_color(230, 230, 230)
-        self.cell(0, 10, title, 0, 1, 'L', True)
-        self.ln(3)
-        
-    def chapter_body(self, body: str):
-        """Body chapter"""
-        self.set_font('Arial', '', 11)
-        self.multi_cell(0, 6, body)
-        self.ln(2)
+    rows = map(_HISTORY_CSV_ROW.format, timestamps, symptom_counts, top_names, confidences)
+    return (_HISTORY_CSV_HEADER + ''.join(rows)).encode('utf-8')
 
 
 class DiagnosisExporter:
@@ -61,14 +137,14 @@ class DiagnosisExporter:
         
     def _ensure_export_dir(self):
         """Pastikan directory export ada"""
-        if not os.path.exists(self.export_dir):
-            os.makedirs(self.export_dir)
+        os.makedirs(self.export_dir, exist_ok=True)
     
     def export_to_pdf(self, 
                      diagnosis_data: Dict,
                      symptoms: List[str],
                      reasoning_trace: List[Dict],
-                     output_filename: str = None) -> str:
+                     output_filename: str = None,
+                     now: datetime = None) -> str:
         """
         Export hasil diagnosis ke PDF
         
@@ -77,36 +153,138 @@ class DiagnosisExporter:
             symptoms: List gejala yang dipilih
             reasoning_trace: Trace reasoning
             output_filename: Nama file output (optional)
+            now: Waktu export (default: datetime.now())
             
         Returns:
             Path file PDF yang dibuat
         """
+        now = now or datetime.now()
+        
         if output_filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = _file_timestamp(now)
             output_filename = f'diagnosis_{timestamp}.pdf'
         
         output_path = os.path.join(self.export_dir, output_filename)
         
-        # Create PDF
-        pdf = DiagnosisPDFExporter()
-        pdf.add_page()
+        self._write_pdf(output_path, self._build_flowables(diagnosis_data, symptoms, reasoning_trace, now))
+        
+        return output_path
+    
+    def export_many_to_pdf(self,
+                           reports: List[Dict],
+                           output_filename: str = None,
+                           now: datetime = None) -> str:
+        """
+        Export banyak hasil diagnosis ke satu file PDF
+        
+        Args:
+            reports: List dict dengan key diagnosis_data, symptoms, reasoning_trace
+                (sama dengan argumen export_to_pdf)
+            output_filename: Nama file output (optional)
+            now: Waktu export (default: datetime.now())
+            
+        Returns:
+            Path file PDF yang dibuat
+        """
+        now = now or datetime.now()
+        
+        if output_filename is None:
+            timestamp = _file_timestamp(now)
+            output_filename = f'diagnosis_batch_{timestamp}.pdf'
+        
+        output_path = os.path.join(self.export_dir, output_filename)
+        
+        # Satu dokumen: header/trailer, font, dan form statis dipakai bersama
+        self._write_pdf(output_path, self._build_many_flowables(reports, now))
+        
+        return output_path
+    
+    def export_many_to_pdf_parallel(self,
+                                    reports: List[Dict],
+                                    workers: int = None,
+                                    now: datetime = None) -> List[str]:
+        """
+        Export banyak hasil diagnosis ke file PDF terpisah secara paralel
+        
+        Args:
+            reports: List dict dengan key diagnosis_data, symptoms, reasoning_trace
+                (sama dengan argumen export_to_pdf)
+            workers: Jumlah proses (default: os.cpu_count())
+            now: Waktu export (default: datetime.now())
+            
+        Returns:
+            List path file PDF, urut sesuai reports
+        """
+        now = now or datetime.now()
+        timestamp = _file_timestamp(now)
+        
+        jobs = [
+            (report, f'diagnosis_{timestamp}_{i:03d}.pdf', now)
+            for i, report in enumerate(reports, 1)
+        ]
+        
+        # Layout PDF terikat CPU (GIL), jadi pakai proses, bukan thread.
+        # Spawn, bukan fork: proses app multi-thread (Streamlit, listener
+        # logger) dan fork bisa mewarisi lock yang sedang dipegang thread lain
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_pdf_worker,
+                                 initargs=(self.export_dir,)) as executor:
+            return list(executor.map(_export_pdf_job, jobs))
+    
+    def _write_pdf(self, output_path: str, flowables: Iterator):
+        """Build PDF di memory lalu tulis ke file sekaligus"""
+        buffer = io.BytesIO()
+        _pdf().DiagnosisPDFExporter(buffer).build_report(flowables)
+        _write_file(output_path, buffer.getbuffer())
+    
+    def _build_many_flowables(self, reports: List[Dict], now: datetime) -> Iterator:
+        """Gabungkan flowables beberapa laporan, dipisah page break"""
+        for i, report in enumerate(reports):
+            if i:
+                yield _pdf().page_break()
+            yield from self._build_flowables(
+                report.get('diagnosis_data', {}),
+                report.get('symptoms', []),
+                report.get('reasoning_trace', []),
+                now
+            )
+    
+    def _build_flowables(self,
+                         diagnosis_data: Dict,
+                         symptoms: List[str],
+                         reasoning_trace: List[Dict],
+                         now: datetime) -> Iterator:
+        """
+        Generate isi laporan PDF sebagai reportlab flowables
+        
+        Args:
+            diagnosis_data: Data diagnosis
+            symptoms: List gejala yang dipilih
+            reasoning_trace: Trace reasoning
+            now: Waktu export
+            
+        Yields:
+            Flowable untuk SimpleDocTemplate
+        """
+        pdf = _pdf()
         
         # Informasi Umum
-        pdf.chapter_title('INFORMASI DIAGNOSIS')
+        yield pdf.title('INFORMASI DIAGNOSIS')
         info_text = f"""
-Tanggal: {datetime.now().strftime('%d %B %Y, %H:%M:%S')}
+Tanggal: {now.strftime('%d %B %Y, %H:%M:%S')}
 Session ID: {diagnosis_data.get('session_id', 'N/A')}
 Total Gejala: {len(symptoms)}
         """
-        pdf.chapter_body(info_text.strip())
+        yield pdf.body(info_text.strip())
         
         # Gejala yang Dipilih
-        pdf.chapter_title('GEJALA YANG DIALAMI')
+        yield pdf.title('GEJALA YANG DIALAMI')
         symptoms_text = '\n'.join([f"- {symptom}" for symptom in symptoms])
-        pdf.chapter_body(symptoms_text)
+        yield pdf.body(symptoms_text)
         
         # Hasil Diagnosis
-        pdf.chapter_title('HASIL DIAGNOSIS')
+        yield pdf.title('HASIL DIAGNOSIS')
         
         diagnoses = diagnosis_data.get('diagnoses', [])
         
@@ -133,221 +311,282 @@ Tingkat Kesulitan: {diag.get('repair_difficulty', 'Unknown')}
 Pencegahan:
 {self._format_list(diag.get('prevention', []))}
             """
-            pdf.chapter_body(diagnosis_text.strip())
-            pdf.ln(3)
+            yield pdf.body(diagnosis_text.strip())
+            yield pdf.spacer(3)
         
         # Reasoning Explanation
         if reasoning_trace:
-            pdf.add_page()
-            pdf.chapter_title('PENJELASAN REASONING')
+            yield pdf.page_break()
+            yield pdf.title('PENJELASAN REASONING')
             
-            reasoning_text = "Sistem sampai pada kesimpulan melalui langkah-langkah berikut:\n\n"
+            parts = ["Sistem sampai pada kesimpulan melalui langkah-langkah berikut:\n\n"]
             
             for i, trace in enumerate(reasoning_trace[:10], 1):
                 if trace.get('type') == 'rule_fired':
-                    reasoning_text += f"{i}. Rule {trace.get('rule_id')}:\n"
-                    reasoning_text += f"   IF: {', '.join(trace.get('conditions', []))}\n"
-                    reasoning_text += f"   THEN: {trace.get('conclusion')}\n"
-                    reasoning_text += f"   CF: {trace.get('cf', 0)*100:.0f}%\n\n"
+                    parts.append(
+                        f"{i}. Rule {trace.get('rule_id')}:\n"
+                        f"   IF: {', '.join(trace.get('conditions', []))}\n"
+                        f"   THEN: {trace.get('conclusion')}\n"
+                        f"   CF: {trace.get('cf', 0)*100:.0f}%\n\n"
+                    )
             
-            pdf.chapter_body(reasoning_text)
-        
-        # Rekomendasi
-        pdf.add_page()
-        pdf.chapter_title('REKOMENDASI')
+            yield pdf.body(''.join(parts))
         
-        recommendation_text = """
-LANGKAH SELANJUTNYA:
-
-1. Backup Data Penting
-   Sebelum melakukan perbaikan apapun, pastikan untuk melakukan backup
-   semua data penting (foto, kontak, dokumen, dll).
-
-2. Konsultasi Profesional
-   Jika Anda tidak yakin, sebaiknya konsultasikan dengan teknisi
-   profesional untuk menghindari kerusakan lebih lanjut.
-
-3. Garansi
-   Cek apakah smartphone masih dalam masa garansi. Perbaikan resmi
-   melalui service center dapat mencegah void garansi.
-
-4. Preventive Maintenance
-   Lakukan perawatan rutin setiap 6 bulan untuk mencegah kerusakan.
-
-PERINGATAN:
-- Jangan coba perbaikan sendiri jika tidak berpengalaman
-- Matikan smartphone jika terjadi overheating atau baterai kembung
-- Jangan gunakan charger tidak resmi
-- Hindari tempat lembab dan suhu ekstrem
-        """
-        pdf.chapter_body(recommendation_text.strip())
-        
-        # Footer info
-        pdf.ln(10)
-        pdf.set_font('Arial', 'I', 9)
-        footer_text = """
----
-Laporan ini dihasilkan oleh Sistem Pakar Identifikasi Kerusakan Smartphone
-Kelompok 2 - INF313 Kecerdasan Artifisial
-Disclaimer: Hasil diagnosis bersifat rekomendasi. Konsultasi dengan profesional
-untuk diagnosis definitif.
-        """
-        pdf.multi_cell(0, 5, footer_text.strip())
-        
-        # Save PDF
-        pdf.output(output_path)
-        
-        return output_path
+        # Rekomendasi + disclaimer (statis, di-render sekali sebagai Form XObject)
+        yield pdf.page_break()
+        yield pdf.recommendation()
     
     def _format_list(self, items: List[str]) -> str:
         """Format list menjadi string dengan bullet"""
         if not items:
             return "- Tidak ada informasi"
-        return '\n'.join([f"- {item}" for item in items])
+        return '- ' + '\n- '.join(map(str, items))
     
     def _format_solutions(self, solutions: List[Dict]) -> str:
         """Format solutions menjadi string terstruktur"""
         if not solutions:
             return "- Tidak ada solusi tersedia"
         
-        formatted = []
-        for sol in solutions:
-            step = sol.get('step', '?')
-            action = sol.get('action', 'Unknown')
-            detail = sol.get('detail', '')
-            formatted.append(f"Langkah {step}: {action}\n   {detail}")
-        
-        return '\n\n'.join(formatted)
+        return '\n\n'.join(
+            f"Langkah {sol.get('step', '?')}: {sol.get('action', 'Unknown')}\n   {sol.get('detail', '')}"
+            for sol in solutions
+        )
     
     def export_to_json(self, 
-                      diagnosis_data: Dict,
-                      output_filename: str = None) -> str:
+                      diagnosis_data: Union[Dict, bytes],
+                      output_filename: str = None,
+                      now: datetime = None) -> str:
         """
         Export hasil diagnosis ke JSON
         
         Args:
-            diagnosis_data: Data diagnosis
+            diagnosis_data: Data diagnosis, atau JSON yang sudah di-serialize
+                (bytes/bytearray/memoryview UTF-8) yang disisipkan apa adanya
+            output_filename: Nama file output
+            now: Waktu export (default: datetime.now())
+            
+        Returns:
+            Path file JSON yang dibuat
+        """
+        output_path, payload = self._json_payload(diagnosis_data, output_filename, now)
+        
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+        
+        return output_path
+    
+    async def aexport_to_json(self,
+                              diagnosis_data: Union[Dict, bytes],
+                              output_filename: str = None,
+                              now: datetime = None) -> str:
+        """
+        Versi async dari export_to_json, tidak memblokir event loop
+        
+        Args:
+            diagnosis_data: Data diagnosis, atau JSON yang sudah di-serialize
             output_filename: Nama file output
+            now: Waktu export (default: datetime.now())
             
         Returns:
             Path file JSON yang dibuat
         """
+        output_path, payload = self._json_payload(diagnosis_data, output_filename, now)
+        
+        if aiofiles is not None:
+            async with aiofiles.open(output_path, 'wb') as f:
+                await f.write(payload)
+        else:
+            # run_in_executor, bukan asyncio.to_thread (baru ada di Python 3.9)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_file, output_path, payload)
+        
+        return output_path
+    
+    def _json_payload(self, diagnosis_data, output_filename, now):
+        """Susun path output dan isi file JSON export"""
+        now = now or datetime.now()
+        
         if output_filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = _file_timestamp(now)
             output_filename = f'diagnosis_{timestamp}.json'
         
         output_path = os.path.join(self.export_dir, output_filename)
         
         # Add metadata
         export_data = {
-            'export_date': datetime.now().isoformat(),
+            'export_date': _iso_timestamp(now),
             'export_format': 'json',
-            'version': '1.0',
-            'data': diagnosis_data
+            'version': '1.0'
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if isinstance(diagnosis_data, (bytes, bytearray, memoryview)):
+            # Sudah JSON: sisipkan ke envelope tanpa parse + serialize ulang
+            envelope = _dump_json(export_data)
+            payload = b''.join((envelope[:-2],  # buang '\n}' penutup
+                                b',\n  "data": ', diagnosis_data, b'\n}'))
+        else:
+            export_data['data'] = diagnosis_data
+            payload = _dump_json(export_data)
+        
+        return output_path, payload
+    
+    def export_many_to_json(self,
+                            diagnoses: List[Dict],
+                            output_filename: str = None,
+                            now: datetime = None) -> str:
+        """
+        Export banyak hasil diagnosis ke satu file JSON Lines
+        
+        Args:
+            diagnoses: List data diagnosis (satu baris per item)
+            output_filename: Nama file output
+            now: Waktu export (default: datetime.now())
+            
+        Returns:
+            Path file JSONL yang dibuat
+        """
+        now = now or datetime.now()
+        
+        if output_filename is None:
+            timestamp = _file_timestamp(now)
+            output_filename = f'diagnosis_batch_{timestamp}.jsonl'
+        
+        output_path = os.path.join(self.export_dir, output_filename)
+        
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            for diagnosis_data in diagnoses:
+                f.write(_dump_json_line(diagnosis_data))
         
         return output_path
     
     def export_to_csv(self,
                      diagnosis_data: Dict,
-                     output_filename: str = None) -> str:
+                     output_filename: str = None,
+                     now: datetime = None) -> str:
         """
         Export hasil diagnosis ke CSV
         
         Args:
             diagnosis_data: Data diagnosis
             output_filename: Nama file output
+            now: Waktu export (default: datetime.now())
             
         Returns:
             Path file CSV yang dibuat
         """
+        now = now or datetime.now()
+        
         if output_filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = _file_timestamp(now)
             output_filename = f'diagnosis_{timestamp}.csv'
         
         output_path = os.path.join(self.export_dir, output_filename)
         
         diagnoses = diagnosis_data.get('diagnoses', [])
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
             if not diagnoses:
                 return output_path
             
-            # Get all possible fields
-            fieldnames = ['rank', 'diagnosis', 'type', 'confidence', 
-                         'description', 'estimated_cost', 'repair_difficulty']
+            row = _DIAGNOSIS_CSV_ROW.format
+            q = _csv_field
             
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            f.write(_DIAGNOSIS_CSV_HEADER.encode('utf-8'))
             
             for i, diag in enumerate(diagnoses, 1):
-                writer.writerow({
-                    'rank': i,
-                    'diagnosis': diag.get('name', 'Unknown'),
-                    'type': diag.get('type', 'Unknown'),
-                    'confidence': f"{diag.get('confidence', 0)*100:.1f}%",
-                    'description': diag.get('description', '')[:100] + '...',
-                    'estimated_cost': diag.get('estimated_cost', '0'),
-                    'repair_difficulty': diag.get('repair_difficulty', 'Unknown')
-                })
+                desc = diag.get('description', '')
+                if len(desc) > 100:
+                    desc = desc[:100] + '...'
+                f.write(row(
+                    i,
+                    q(diag.get('name', 'Unknown')),
+                    q(diag.get('type', 'Unknown')),
+                    diag.get('confidence', 0)*100,
+                    q(desc),
+                    q(diag.get('estimated_cost', '0')),
+                    q(diag.get('repair_difficulty', 'Unknown'))
+                ).encode('utf-8'))
         
         return output_path
     
     def export_history(self,
                       history: List[Dict],
                       format: str = 'json',
-                      output_filename: str = None) -> str:
+                      output_filename: str = None,
+                      now: datetime = None) -> str:
         """
         Export riwayat diagnosis
         
         Args:
             history: List riwayat diagnosis
-            format: Format output (json, csv)
+            format: Format output (json, csv, msgpack)
             output_filename: Nama file output
+            now: Waktu export (default: datetime.now())
             
         Returns:
             Path file yang dibuat
         """
+        now = now or datetime.now()
+        
         if output_filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = _file_timestamp(now)
             output_filename = f'history_{timestamp}.{format}'
         
         output_path = os.path.join(self.export_dir, output_filename)
         
         if format == 'json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'export_date': datetime.now().isoformat(),
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(_dump_json({
+                    'export_date': _iso_timestamp(now),
                     'total_entries': len(history),
                     'history': history
-                }, f, indent=2, ensure_ascii=False)
+                }))
+        
+        elif format == 'msgpack':
+            # Binary, lebih kecil dan lebih cepat untuk arsip riwayat yang besar
+            if msgpack is None:
+                raise ImportError("Format 'msgpack' membutuhkan package msgpack")
+            
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                msgpack.pack({
+                    'export_date': _iso_timestamp(now),
+                    'total_entries': len(history),
+                    'history': history
+                }, f, use_bin_type=True)
         
         elif format == 'csv':
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
                 if not history:
                     return output_path
                 
-                fieldnames = ['timestamp', 'symptoms_count', 'top_diagnosis', 'confidence']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for entry in history:
-                    diagnoses = entry.get('diagnoses', [])
-                    top_diag = diagnoses[0] if diagnoses else {}
-                    
-                    writer.writerow({
-                        'timestamp': entry.get('timestamp', 'Unknown'),
-                        'symptoms_count': len(entry.get('symptoms', [])),
-                        'top_diagnosis': top_diag.get('diagnosis', 'Unknown'),
-                        'confidence': f"{top_diag.get('cf', 0)*100:.1f}%" if top_diag else 'N/A'
-                    })
+                f.write(_history_csv_bytes(history))
         
         return output_path
 
 
+# Exporter per proses worker untuk export_many_to_pdf_parallel
+_worker_exporter = None
+
+
+def _init_pdf_worker(export_dir: str):
+    """Initializer worker: buat exporter dan import reportlab sekali per proses"""
+    global _worker_exporter
+    _worker_exporter = DiagnosisExporter(export_dir)
+    _pdf()
+
+
+def _export_pdf_job(job) -> str:
+    """Export satu laporan PDF di proses worker"""
+    report, output_filename, now = job
+    return _worker_exporter.export_to_pdf(
+        report.get('diagnosis_data', {}),
+        report.get('symptoms', []),
+        report.get('reasoning_trace', []),
+        output_filename,
+        now
+    )
+
+
 # Example usage
 if __name__ == "__main__":
     print("=" * 70)
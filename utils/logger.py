@@ -3,66 +3,237 @@ Logging System
 Advanced logging untuk sistem pakar smartphone
 """
 
+import atexit
 import logging
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
 from datetime import datetime
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback ke stdlib json
+    orjson = None
+
+
+_FILE_BUFFER_SIZE = 64 * 1024
+_EVENT_TYPES = {
+    name: sys.intern(name)
+    for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL',
+                 'DIAGNOSIS_START', 'DIAGNOSIS_RESULT', 'RULE_FIRED',
+                 'INFERENCE_ITERATION', 'KB_OPERATION', 'USER_ACTION',
+                 'ERROR_TRACEBACK', 'PERFORMANCE')
+}
+_ERROR_EVENT_TYPES = frozenset(('ERROR', 'ERROR_TRACEBACK', 'CRITICAL'))
+_TS_FMT = '%Y-%m-%dT%H:%M:%S'
+
+# Template pesan domain helper; diformat sekali per panggilan, hasilnya
+# dipakai untuk stdlib logger dan session event
+_DIAGNOSIS_START_MSG = 'Diagnosis started with %d symptoms'
+_DIAGNOSIS_RESULT_MSG = 'Diagnosis: %s (CF: %.2f)'
+_RULE_FIRED_MSG = 'Rule fired: %s -> %s'
+_ITERATION_MSG = 'Iteration %s: %s facts'
+_KB_OPERATION_MSG = 'KB Operation %s on %s: %s'
+_USER_ACTION_MSG = 'User action: %s'
+_ERROR_MSG = 'Error in %s: %s'
+_PERFORMANCE_MSG = 'Performance: %s took %.3fs'
+
+
+def _dump_json(data, pretty: bool = False) -> bytes:
+    """Serialize data ke JSON (UTF-8), orjson jika tersedia"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            # orjson.JSONEncodeError (subclass TypeError): mis. int di luar
+            # 64-bit; stdlib json masih bisa meng-encode
+            pass
+    return json.dumps(data, indent=2 if pretty else None, ensure_ascii=False,
+                      default=str).encode('utf-8')
+
+
+def _dump_json_line(data) -> bytes:
+    """Serialize data ke satu baris JSON Lines"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # fallback ke stdlib json, lihat _dump_json
+    return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+
+
+def _intern_id(value):
+    """sys.intern untuk str biasa; nilai lain (None, int, subclass str) apa adanya"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _iso_now() -> str:
+    """Timestamp lokal ISO-8601 (mikrodetik) tanpa membuat objek datetime"""
+    now = time.time()
+    return time.strftime(_TS_FMT, time.localtime(now)) + f'.{int(now % 1 * 1e6):06d}'
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler dengan buffer 64KB, tanpa flush per record"""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchHandler(MemoryHandler):
+    """MemoryHandler yang juga flush stream target setelah tiap batch"""
+    
+    def flush(self):
+        super().flush()
+        self.acquire()
+        try:
+            if self.target is not None:
+                self.target.flush()
+        finally:
+            self.release()
+
 
 class SmartphoneExpertLogger:
     """Advanced logger untuk sistem pakar"""
     
-    def __init__(self, name: str = 'smartphone_expert', log_dir: str = 'logs'):
+    __slots__ = (
+        'name', 'log_dir', 'logger', 'session_id', 'session_log_file',
+        'session_events_file', '_log_queue', '_listener', '_jsonl_file',
+        '_ev_type', '_ev_msg', '_ev_data', '_ev_ts',
+        '_event_type_counts', '_rule_freq', '_diagnoses', '_errors',
+        '_confidence_sum', '_confidence_n', '_t_start', '_t_last',
+        '_record_debug_events', '_flush_executor'
+    )
+    
+    def __init__(self, name: str = 'smartphone_expert', log_dir: str = 'logs',
+                 record_debug_events: bool = True):
         """
         Initialize logger
         
         Args:
             name: Logger name
             log_dir: Directory untuk log files
+            record_debug_events: Catat event level DEBUG ke session walaupun
+                logger tidak meng-emit DEBUG
         """
         self.name = name
         self.log_dir = log_dir
+        self._record_debug_events = record_debug_events
         self._ensure_log_dir()
         
         # Create logger
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
+        self._listener = None
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
             self._setup_handlers()
         
         # Session info
-        self.session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.session_log_file = os.path.join(
-            log_dir, 
-            f'session_{self.session_id}.json'
-        )
-        self.session_events = []
+        self._open_session_files(datetime.now().strftime('%Y%m%d_%H%M%S'))
+        
+        # Event disimpan per kolom (bukan list of dict)
+        self._ev_type = []
+        self._ev_msg = []
+        self._ev_data = []
+        self._ev_ts = []
+        
+        # Statistik di-update saat event masuk (tanpa scan ulang)
+        self._event_type_counts = Counter()
+        self._rule_freq = Counter()
+        self._diagnoses = []
+        self._errors = []
+        self._confidence_sum = 0.0
+        self._confidence_n = 0
+        
+        # Durasi session dari clock monotonic (tahan terhadap perubahan jam)
+        self._t_start = self._t_last = time.monotonic()
+        
+        self._flush_executor = ThreadPoolExecutor(max_workers=1,
+                                                  thread_name_prefix='logger-flush')
+        
+        atexit.register(self.close)
+    
+    def _open_session_files(self, timestamp: str):
+        """
+        Tentukan session ID dan buka sidecar JSON Lines (semua event
+        di-stream ke sini saat terjadi)
+        
+        Sidecar dibuat eksklusif ('xb'): logger lain yang dibuat pada detik
+        yang sama mendapat suffix _2, _3, ... sehingga tidak berbagi file.
+        """
+        session_id = timestamp
+        n = 1
+        while True:
+            events_file = os.path.join(self.log_dir, f'session_{session_id}.jsonl')
+            try:
+                self._jsonl_file = open(events_file, 'xb', buffering=_FILE_BUFFER_SIZE)
+                break
+            except FileExistsError:
+                n += 1
+                session_id = f'{timestamp}_{n}'
+        
+        self.session_id = session_id
+        self.session_events_file = events_file
+        self.session_log_file = os.path.join(self.log_dir, f'session_{session_id}.json')
+    
+    def _debug_disabled(self) -> bool:
+        """True jika event DEBUG tidak dicatat maupun di-emit"""
+        return not self._record_debug_events and not self.logger.isEnabledFor(logging.DEBUG)
     
     def _ensure_log_dir(self):
         """Pastikan directory log ada"""
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
     
     def _setup_handlers(self):
         """Setup logging handlers"""
         
-        # File Handler - All levels
+        # File Handler - All levels (ditulis per batch, ERROR langsung flush)
         all_log_file = os.path.join(self.log_dir, 'system.log')
-        file_handler = logging.FileHandler(all_log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        file_handler = _BufferedFileHandler(all_log_file, encoding='utf-8')
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
+        buffered_file = _BatchHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_file.setLevel(logging.DEBUG)
         
         # File Handler - Error only
         error_log_file = os.path.join(self.log_dir, 'errors.log')
-        error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
-        error_handler.setLevel(logging.ERROR)
+        error_handler = _BufferedFileHandler(error_log_file, encoding='utf-8')
         error_handler.setFormatter(file_formatter)
+        buffered_error = _BatchHandler(
+            capacity=16,
+            flushLevel=logging.ERROR,
+            target=error_handler,
+            flushOnClose=True
+        )
+        buffered_error.setLevel(logging.ERROR)
         
         # Console Handler
         console_handler = logging.StreamHandler()
@@ -72,14 +243,47 @@ class SmartphoneExpertLogger:
         )
         console_handler.setFormatter(console_formatter)
         
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(console_handler)
+        # Logger hanya enqueue record; I/O dikerjakan thread listener
+        self._log_queue = SimpleQueue()
+        self.logger.addHandler(QueueHandler(self._log_queue))
+        self._listener = QueueListener(
+            self._log_queue,
+            buffered_file,
+            buffered_error,
+            console_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+    
+    def close(self):
+        """Stop listener, flush semua record yang tersisa, dan tutup file"""
+        if self._flush_executor is not None:
+            self._flush_executor.shutdown(wait=True)
+            self._flush_executor = None
+        
+        if self._jsonl_file is not None:
+            self._jsonl_file.close()
+            self._jsonl_file = None
+        
+        if self._listener is None:
+            return
+        
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is self._log_queue:
+                self.logger.removeHandler(handler)
+        self._listener = None
     
     # Basic logging methods
     def debug(self, message: str, **kwargs):
         """Log debug message"""
+        if self._debug_disabled():
+            return
         self.logger.debug(message)
         self._log_session_event('DEBUG', message, kwargs)
     
@@ -106,216 +310,324 @@ class SmartphoneExpertLogger:
     # Domain-specific logging methods
     def log_diagnosis_start(self, symptoms: list):
         """Log start of diagnosis"""
-        message = f"Diagnosis started with {len(symptoms)} symptoms"
-        self.info(message, symptoms=symptoms)
+        ts = _iso_now()
+        message = _DIAGNOSIS_START_MSG % (len(symptoms),)
+        self.logger.info(message)
+        self._log_session_event('INFO', message, {'symptoms': symptoms}, ts)
         
         self._log_session_event('DIAGNOSIS_START', message, {
             'symptoms': symptoms,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     def log_diagnosis_result(self, diagnosis: str, confidence: float):
         """Log diagnosis result"""
-        message = f"Diagnosis: {diagnosis} (CF: {confidence:.2f})"
-        self.info(message)
+        ts = _iso_now()
+        message = _DIAGNOSIS_RESULT_MSG % (diagnosis, confidence)
+        self.logger.info(message)
+        self._log_session_event('INFO', message, {}, ts)
         
-        self._log_session_event('DIAGNOSIS_RESULT', message, {
+        self._diagnoses.append({
             'diagnosis': diagnosis,
             'confidence': confidence,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts
         })
+        self._confidence_sum += confidence
+        self._confidence_n += 1
+        
+        self._log_session_event('DIAGNOSIS_RESULT', message, {
+            'diagnosis': diagnosis,
+            'confidence': confidence,
+            'timestamp': ts
+        }, ts)
     
     def log_rule_fired(self, rule_id: str, conditions: list, conclusion: str):
         """Log when a rule is fired"""
-        message = f"Rule fired: {rule_id} -> {conclusion}"
-        self.debug(message)
+        if self._debug_disabled():
+            return
         
+        rule_id = _intern_id(rule_id)
+        ts = _iso_now()
+        message = _RULE_FIRED_MSG % (rule_id, conclusion)
+        self.logger.debug(message)
+        self._log_session_event('DEBUG', message, {}, ts)
+        
+        self._rule_freq[rule_id] += 1
         self._log_session_event('RULE_FIRED', message, {
             'rule_id': rule_id,
             'conditions': conditions,
             'conclusion': conclusion,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     def log_inference_iteration(self, iteration: int, facts_count: int):
         """Log inference iteration"""
-        message = f"Iteration {iteration}: {facts_count} facts"
-        self.debug(message)
+        if self._debug_disabled():
+            return
+        
+        ts = _iso_now()
+        message = _ITERATION_MSG % (iteration, facts_count)
+        self.logger.debug(message)
+        self._log_session_event('DEBUG', message, {}, ts)
         
         self._log_session_event('INFERENCE_ITERATION', message, {
             'iteration': iteration,
             'facts_count': facts_count,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     def log_kb_operation(self, operation: str, target: str, success: bool):
         """Log knowledge base operation"""
+        operation = _intern_id(operation)
+        ts = _iso_now()
         status = "SUCCESS" if success else "FAILED"
-        message = f"KB Operation {operation} on {target}: {status}"
+        message = _KB_OPERATION_MSG % (operation, target, status)
         
         if success:
-            self.info(message)
+            self.logger.info(message)
+            self._log_session_event('INFO', message, {}, ts)
         else:
-            self.warning(message)
+            self.logger.warning(message)
+            self._log_session_event('WARNING', message, {}, ts)
         
         self._log_session_event('KB_OPERATION', message, {
             'operation': operation,
             'target': target,
             'success': success,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     def log_user_action(self, action: str, details: dict = None):
         """Log user action"""
-        message = f"User action: {action}"
-        self.info(message)
+        action = _intern_id(action)
+        ts = _iso_now()
+        message = _USER_ACTION_MSG % (action,)
+        self.logger.info(message)
+        self._log_session_event('INFO', message, {}, ts)
         
         self._log_session_event('USER_ACTION', message, {
             'action': action,
             'details': details or {},
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     def log_error_with_traceback(self, error: Exception, context: str = ""):
         """Log error with full traceback"""
-        import traceback
-        
-        message = f"Error in {context}: {str(error)}"
-        self.error(message)
+        ts = _iso_now()
+        message = _ERROR_MSG % (context, error)
+        self.logger.error(message)
+        self._log_session_event('ERROR', message, {}, ts)
         
-        tb = traceback.format_exc()
-        self.error(f"Traceback:\n{tb}")
+        tb = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+        tb_message = f"Traceback:\n{tb}"
+        self.logger.error(tb_message)
+        self._log_session_event('ERROR', tb_message, {}, ts)
         
         self._log_session_event('ERROR_TRACEBACK', message, {
             'error_type': type(error).__name__,
             'error_message': str(error),
             'traceback': tb,
             'context': context,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     def log_performance(self, operation: str, duration: float):
         """Log performance metrics"""
-        message = f"Performance: {operation} took {duration:.3f}s"
-        self.debug(message)
+        if self._debug_disabled():
+            return
+        
+        ts = _iso_now()
+        message = _PERFORMANCE_MSG % (operation, duration)
+        self.logger.debug(message)
+        self._log_session_event('DEBUG', message, {}, ts)
         
         self._log_session_event('PERFORMANCE', message, {
             'operation': operation,
             'duration': duration,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': ts
+        }, ts)
     
     # Session management
-    def _log_session_event(self, event_type: str, message: str, data: dict):
-        """Log event to session"""
+    def _log_session_event(self, event_type: str, message: str, data: dict, ts: str = None):
+        """
+        Log event to session
+        
+        Args:
+            event_type: Tipe event
+            message: Pesan event
+            data: Data tambahan
+            ts: Timestamp ISO (default: sekarang); helper domain mengirim
+                timestamp yang sama untuk semua event dari satu panggilan
+        """
+        event_type = _EVENT_TYPES.get(event_type, event_type)
+        ts = ts or _iso_now()
+        
         event = {
             'event_type': event_type,
             'message': message,
             'data': data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts
         }
-        self.session_events.append(event)
-    
-    def save_session(self):
-        """Save session log to JSON file"""
         try:
-            session_data = {
-                'session_id': self.session_id,
-                'start_time': self.session_events[0]['timestamp'] if self.session_events else None,
-                'end_time': datetime.now().isoformat(),
-                'total_events': len(self.session_events),
-                'events': self.session_events
+            line = _dump_json_line(event)
+        except (TypeError, ValueError):
+            # Data tidak bisa di-encode (mis. key tuple): simpan repr
+            # supaya logging tidak pernah membuat pemanggil error
+            event['data'] = repr(data)
+            line = _dump_json_line(event)
+        
+        if self._jsonl_file is not None:
+            self._jsonl_file.write(line)
+        else:
+            # Sesudah close(): append langsung supaya sidecar tetap lengkap
+            with open(self.session_events_file, 'ab') as f:
+                f.write(line)
+        
+        self._t_last = time.monotonic()
+        self._ev_type.append(event_type)
+        self._ev_msg.append(message)
+        self._ev_data.append(data)
+        self._ev_ts.append(ts)
+        
+        self._event_type_counts[event_type] += 1
+        if event_type in _ERROR_EVENT_TYPES:
+            self._errors.append({
+                'type': event_type,
+                'message': message,
+                'data': data,
+                'timestamp': ts
+            })
+    
+    @property
+    def events(self) -> list:
+        """Semua event session sebagai list of dict (dibangun saat diminta)"""
+        return [
+            {
+                'event_type': event_type,
+                'message': message,
+                'data': data,
+                'timestamp': ts
             }
+            for event_type, message, data, ts in zip(
+                self._ev_type, self._ev_msg, self._ev_data, self._ev_ts
+            )
+        ]
+    
+    @property
+    def session_events(self) -> list:
+        """Alias lama untuk events"""
+        return self.events
+    
+    def save_session(self, pretty: bool = False, include_events: bool = False) -> Future:
+        """
+        Save ringkasan session ke JSON file; event lengkap ada di
+        sidecar JSON Lines (session_events_file). Encoding dan penulisan
+        dikerjakan thread flush di background.
+        
+        Args:
+            pretty: Tulis JSON ter-indentasi (default: compact)
+            include_events: Sertakan array events; baris JSON dari sidecar
+                disambung apa adanya tanpa encode ulang
             
-            with open(self.session_log_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+        Returns:
+            Future berisi True jika berhasil, False jika gagal
+        """
+        # Snapshot diambil di thread pemanggil; event sesudahnya tidak ikut
+        if self._jsonl_file is not None:
+            self._jsonl_file.flush()
+        events_size = os.path.getsize(self.session_events_file) if include_events else None
+        
+        session_data = {
+            'session_id': self.session_id,
+            'start_time': self._ev_ts[0] if self._ev_ts else None,
+            'end_time': datetime.now().isoformat(),
+            'total_events': len(self._ev_type),
+            'event_types': dict(self._event_type_counts),
+            'events_file': os.path.basename(self.session_events_file)
+        }
+        
+        if self._flush_executor is None:
+            # Sesudah close(): tulis langsung di thread pemanggil
+            future = Future()
+            future.set_result(self._save_session_impl(session_data, pretty, events_size))
+            return future
+        
+        return self._flush_executor.submit(
+            self._save_session_impl, session_data, pretty, events_size
+        )
+    
+    def _save_session_impl(self, session_data: dict, pretty: bool, events_size: int = None) -> bool:
+        """Tulis file session (dijalankan di thread flush)"""
+        try:
+            payload = _dump_json(session_data, pretty)
+            with open(self.session_log_file, 'wb', buffering=1 << 20) as f:
+                if events_size is None:
+                    f.write(payload)
+                else:
+                    # Header, array events, footer ditulis langsung ke buffer
+                    # file; tidak ada string gabungan untuk seluruh session
+                    f.write(payload[:-2] if pretty else payload[:-1])  # buang '}' penutup
+                    f.write(b',\n  "events": [' if pretty else b', "events": [')
+                    with open(self.session_events_file, 'rb') as events:
+                        sep = b''
+                        for line in events:
+                            events_size -= len(line)
+                            if events_size < 0:
+                                break
+                            f.write(sep)
+                            f.write(line[:-1])
+                            sep = b','
+                    f.write(b']\n}' if pretty else b']}')
             
-            self.info(f"Session saved to {self.session_log_file}")
+            # Hanya ke stdlib logger: session event tidak ditulis dari thread ini
+            self.logger.info("Session saved to %s", self.session_log_file)
             return True
         
         except Exception as e:
-            self.error(f"Failed to save session: {str(e)}")
+            self.logger.error("Failed to save session: %s", e)
             return False
     
+    def wait_for_flush(self):
+        """Tunggu sampai semua save_session yang sudah di-submit selesai"""
+        if self._flush_executor is not None:
+            self._flush_executor.submit(int).result()
+    
     def get_session_summary(self) -> dict:
         """Get summary of current session"""
-        event_types = {}
-        for event in self.session_events:
-            event_type = event['event_type']
-            event_types[event_type] = event_types.get(event_type, 0) + 1
-        
         return {
             'session_id': self.session_id,
-            'total_events': len(self.session_events),
-            'event_types': event_types,
+            'total_events': len(self._ev_type),
+            'event_types': dict(self._event_type_counts),
             'duration': self._calculate_session_duration()
         }
     
     def _calculate_session_duration(self) -> float:
         """Calculate session duration in seconds"""
-        if not self.session_events:
-            return 0.0
-        
-        try:
-            start = datetime.fromisoformat(self.session_events[0]['timestamp'])
-            end = datetime.fromisoformat(self.session_events[-1]['timestamp'])
-            return (end - start).total_seconds()
-        except:
-            return 0.0
+        return self._t_last - self._t_start if self._ev_type else 0.0
     
     # Analysis methods
     def get_diagnosis_statistics(self) -> dict:
         """Get statistics from diagnosis events"""
-        diagnoses = []
-        
-        for event in self.session_events:
-            if event['event_type'] == 'DIAGNOSIS_RESULT':
-                diagnoses.append({
-                    'diagnosis': event['data'].get('diagnosis'),
-                    'confidence': event['data'].get('confidence'),
-                    'timestamp': event['data'].get('timestamp')
-                })
-        
         return {
-            'total_diagnoses': len(diagnoses),
-            'diagnoses': diagnoses,
-            'average_confidence': sum(d['confidence'] for d in diagnoses) / len(diagnoses) if diagnoses else 0
+            'total_diagnoses': self._confidence_n,
+            'diagnoses': list(self._diagnoses),
+            'average_confidence': self._confidence_sum / self._confidence_n if self._confidence_n else 0
         }
     
     def get_rule_firing_statistics(self) -> dict:
         """Get statistics about rule firing"""
-        fired_rules = []
-        
-        for event in self.session_events:
-            if event['event_type'] == 'RULE_FIRED':
-                fired_rules.append(event['data'].get('rule_id'))
-        
-        # Count frequency
-        rule_frequency = {}
-        for rule_id in fired_rules:
-            rule_frequency[rule_id] = rule_frequency.get(rule_id, 0) + 1
+        rule_frequency = self._rule_freq.copy()
         
         return {
-            'total_rules_fired': len(fired_rules),
-            'unique_rules': len(set(fired_rules)),
+            'total_rules_fired': sum(rule_frequency.values()),
+            'unique_rules': len(rule_frequency),
             'rule_frequency': rule_frequency,
-            'most_common_rule': max(rule_frequency.items(), key=lambda x: x[1])[0] if rule_frequency else None
+            'most_common_rule': rule_frequency.most_common(1)[0][0] if rule_frequency else None
         }
     
     def get_error_log(self) -> list:
         """Get all error events"""
-        errors = []
-        
-        for event in self.session_events:
-            if event['event_type'] in ['ERROR', 'ERROR_TRACEBACK', 'CRITICAL']:
-                errors.append({
-                    'type': event['event_type'],
-                    'message': event['message'],
-                    'data': event['data'],
-                    'timestamp': event['timestamp']
-                })
-        
-        return errors
+        return list(self._errors)
     
     def export_session_report(self, output_file: str = None):
         """Export session as readable report"""
@@ -326,61 +638,59 @@ class SmartphoneExpertLogger:
             )
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("=" * 70 + "\n")
-                f.write("SESSION REPORT\n")
-                f.write("=" * 70 + "\n\n")
-                
-                summary = self.get_session_summary()
-                f.write(f"Session ID: {summary['session_id']}\n")
-                f.write(f"Total Events: {summary['total_events']}\n")
-                f.write(f"Duration: {summary['duration']:.2f} seconds\n\n")
-                
-                f.write("Event Types:\n")
-                for event_type, count in summary['event_types'].items():
-                    f.write(f"  - {event_type}: {count}\n")
-                
-                # Diagnosis stats
-                f.write("\n" + "=" * 70 + "\n")
-                f.write("DIAGNOSIS STATISTICS\n")
-                f.write("=" * 70 + "\n\n")
-                
-                diag_stats = self.get_diagnosis_statistics()
-                f.write(f"Total Diagnoses: {diag_stats['total_diagnoses']}\n")
-                f.write(f"Average Confidence: {diag_stats['average_confidence']:.2%}\n\n")
-                
-                for diag in diag_stats['diagnoses']:
-                    f.write(f"  - {diag['diagnosis']}: {diag['confidence']:.2%}\n")
-                
-                # Rule stats
-                f.write("\n" + "=" * 70 + "\n")
-                f.write("RULE FIRING STATISTICS\n")
-                f.write("=" * 70 + "\n\n")
-                
-                rule_stats = self.get_rule_firing_statistics()
-                f.write(f"Total Rules Fired: {rule_stats['total_rules_fired']}\n")
-                f.write(f"Unique Rules: {rule_stats['unique_rules']}\n")
-                f.write(f"Most Common Rule: {rule_stats['most_common_rule']}\n\n")
-                
-                f.write("Rule Frequency:\n")
-                for rule_id, count in sorted(
-                    rule_stats['rule_frequency'].items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
-                )[:10]:
-                    f.write(f"  - {rule_id}: {count} times\n")
-                
-                # Errors
-                errors = self.get_error_log()
-                if errors:
-                    f.write("\n" + "=" * 70 + "\n")
-                    f.write("ERRORS\n")
-                    f.write("=" * 70 + "\n\n")
-                    
-                    for error in errors:
-                        f.write(f"[{error['timestamp']}] {error['type']}: {error['message']}\n")
-                
-                f.write("\n" + "=" * 70 + "\n")
+            rule = "=" * 70 + "\n"
+            parts = [rule, "SESSION REPORT\n", rule, "\n"]
+            
+            summary = self.get_session_summary()
+            parts.append(f"Session ID: {summary['session_id']}\n")
+            parts.append(f"Total Events: {summary['total_events']}\n")
+            parts.append(f"Duration: {summary['duration']:.2f} seconds\n\n")
+            
+            parts.append("Event Types:\n")
+            parts.extend(
+                f"  - {event_type}: {count}\n"
+                for event_type, count in summary['event_types'].items()
+            )
+            
+            # Diagnosis stats
+            parts += ["\n", rule, "DIAGNOSIS STATISTICS\n", rule, "\n"]
+            
+            diag_stats = self.get_diagnosis_statistics()
+            parts.append(f"Total Diagnoses: {diag_stats['total_diagnoses']}\n")
+            parts.append(f"Average Confidence: {diag_stats['average_confidence']:.2%}\n\n")
+            
+            parts.extend(
+                f"  - {diag['diagnosis']}: {diag['confidence']:.2%}\n"
+                for diag in diag_stats['diagnoses']
+            )
+            
+            # Rule stats
+            parts += ["\n", rule, "RULE FIRING STATISTICS\n", rule, "\n"]
+            
+            rule_stats = self.get_rule_firing_statistics()
+            parts.append(f"Total Rules Fired: {rule_stats['total_rules_fired']}\n")
+            parts.append(f"Unique Rules: {rule_stats['unique_rules']}\n")
+            parts.append(f"Most Common Rule: {rule_stats['most_common_rule']}\n\n")
+            
+            parts.append("Rule Frequency:\n")
+            parts.extend(
+                f"  - {rule_id}: {count} times\n"
+                for rule_id, count in rule_stats['rule_frequency'].most_common(10)
+            )
+            
+            # Errors
+            errors = self.get_error_log()
+            if errors:
+                parts += ["\n", rule, "ERRORS\n", rule, "\n"]
+                parts.extend(
+                    f"[{error['timestamp']}] {error['type']}: {error['message']}\n"
+                    for error in errors
+                )
+            
+            parts += ["\n", rule]
+            
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(''.join(parts))
             
             self.info(f"Session report exported to {output_file}")
             return output_file
@@ -390,12 +700,13 @@ class SmartphoneExpertLogger:
             return None
 
 
-# Singleton instance
-_logger_instance = None
+# Singleton instance per nama
+_loggers = {}
+_logger_lock = threading.Lock()
 
 def get_logger(name: str = 'smartphone_expert') -> SmartphoneExpertLogger:
     """
-    Get logger instance (singleton)
+    Get logger instance (singleton, thread-safe)
     
     Args:
         name: Logger name
@@ -403,10 +714,13 @@ def get_logger(name: str = 'smartphone_expert') -> SmartphoneExpertLogger:
     Returns:
         SmartphoneExpertLogger instance
     """
-    global _logger_instance
-    if _logger_instance is None:
-        _logger_instance = SmartphoneExpertLogger(name)
-    return _logger_instance
+    logger = _loggers.get(name)
+    if logger is None:
+        with _logger_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                logger = _loggers[name] = SmartphoneExpertLogger(name)
+    return logger
 
 
 # Example usage
@@ -0,0 +1,235 @@
+"""
+PDF Report Module
+Layout laporan diagnosis PDF (reportlab), di-import oleh export saat dibutuhkan
+"""
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import Flowable, PageBreak, Paragraph, SimpleDocTemplate, Spacer
+from xml.sax.saxutils import escape
+from typing import Iterator, List
+
+
+# Font metrics disimpan reportlab di registry global per proses; load di
+# sini supaya semua dokumen (dan worker paralel) memakai metrics yang sama
+for _font_name in ('Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique'):
+    pdfmetrics.getFont(_font_name)
+
+# Paragraph styles, dibuat sekali saat import
+_TITLE_STYLE = ParagraphStyle(
+    'ChapterTitle',
+    fontName='Helvetica-Bold',
+    fontSize=14,
+    leading=20,
+    backColor=colors.Color(230 / 255, 230 / 255, 230 / 255),
+    borderPadding=(2, 2, 2, 2),
+    spaceBefore=2,
+    spaceAfter=3 * mm
+)
+
+_BODY_STYLE = ParagraphStyle(
+    'ChapterBody',
+    fontName='Helvetica',
+    fontSize=11,
+    leading=6 * mm,
+    spaceAfter=2 * mm
+)
+
+_NOTE_STYLE = ParagraphStyle(
+    'Note',
+    fontName='Helvetica-Oblique',
+    fontSize=9,
+    leading=5 * mm
+)
+
+def _markup(text: str) -> str:
+    """Markup Paragraph dari plain text (newline dan indentasi dipertahankan)"""
+    lines = escape(text).split('\n')
+    return '<br/>'.join(
+        '&nbsp;' * (len(line) - len(line.lstrip(' '))) + line.lstrip(' ')
+        for line in lines
+    )
+
+
+def _paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """Paragraph dari plain text (newline dan indentasi dipertahankan)"""
+    return Paragraph(_markup(text), style)
+
+
+class _FormFlowable(Flowable):
+    """
+    Flowables statis yang digambar sekali per dokumen sebagai PDF Form XObject,
+    lalu direferensikan dengan doForm setiap kali muncul
+    """
+    
+    _BLEED = 5  # ruang untuk borderPadding/backColor di luar frame
+    
+    def __init__(self, name: str, flowables: List[Flowable]):
+        super().__init__()
+        self.name = name
+        self.flowables = flowables
+        self._wrapped_width = None
+        self._heights = []
+    
+    def wrap(self, availWidth, availHeight):
+        # Layout statis hanya dihitung ulang jika lebar frame berubah
+        if self._wrapped_width != availWidth:
+            self._heights = [f.wrap(availWidth, availHeight)[1] for f in self.flowables]
+            self._wrapped_width = availWidth
+            self.width = availWidth
+            self.height = sum(self._heights) + sum(
+                f.getSpaceAfter() for f in self.flowables[:-1]
+            )
+        return self.width, self.height
+    
+    def draw(self):
+        canv = self.canv
+        if not canv.hasForm(self.name):
+            canv.beginForm(self.name, -self._BLEED, -self._BLEED,
+                           self.width + self._BLEED, self.height + self._BLEED)
+            y = self.height
+            for f, h in zip(self.flowables, self._heights):
+                y -= h
+                f.drawOn(canv, 0, y)
+                y -= f.getSpaceAfter()
+            canv.endForm()
+        canv.doForm(self.name)
+
+
+_RECOMMENDATION_TEXT = """
+LANGKAH SELANJUTNYA:
+
+1. Backup Data Penting
+   Sebelum melakukan perbaikan apapun, pastikan untuk melakukan backup
+   semua data penting (foto, kontak, dokumen, dll).
+
+2. Konsultasi Profesional
+   Jika Anda tidak yakin, sebaiknya konsultasikan dengan teknisi
+   profesional untuk menghindari kerusakan lebih lanjut.
+
+3. Garansi
+   Cek apakah smartphone masih dalam masa garansi. Perbaikan resmi
+   melalui service center dapat mencegah void garansi.
+
+4. Preventive Maintenance
+   Lakukan perawatan rutin setiap 6 bulan untuk mencegah kerusakan.
+
+PERINGATAN:
+- Jangan coba perbaikan sendiri jika tidak berpengalaman
+- Matikan smartphone jika terjadi overheating atau baterai kembung
+- Jangan gunakan charger tidak resmi
+- Hindari tempat lembab dan suhu ekstrem
+"""
+
+_DISCLAIMER_TEXT = """
+---
+Laporan ini dihasilkan oleh Sistem Pakar Identifikasi Kerusakan Smartphone
+Kelompok 2 - INF313 Kecerdasan Artifisial
+Disclaimer: Hasil diagnosis bersifat rekomendasi. Konsultasi dengan profesional
+untuk diagnosis definitif.
+"""
+
+# Hanya markup (immutable) yang dibagi antar dokumen; flowable menyimpan
+# state layout/canvas sehingga dibuat baru per dokumen (export bisa paralel)
+_RECOMMENDATION_FORM = 'rekomendasi'
+_RECOMMENDATION_MARKUP = _markup(_RECOMMENDATION_TEXT.strip())
+_DISCLAIMER_MARKUP = _markup(_DISCLAIMER_TEXT.strip())
+
+
+# Judul chapter statis di-parse sekali; Paragraph berikutnya memakai
+# fragments yang sama tanpa escape + parse markup ulang
+_TITLE_FRAGS = {
+    text: Paragraph(escape(text), _TITLE_STYLE).frags
+    for text in ('INFORMASI DIAGNOSIS', 'GEJALA YANG DIALAMI',
+                 'HASIL DIAGNOSIS', 'PENJELASAN REASONING')
+}
+
+
+_HEADER_FORM = 'header'
+_HEADER_FONT = ('Helvetica-Bold', 16)
+_SUBTITLE_FONT = ('Helvetica-Oblique', 10)
+_FOOTER_FONT = ('Helvetica-Oblique', 8)
+
+
+class DiagnosisPDFExporter(SimpleDocTemplate):
+    """Custom PDF document untuk laporan diagnosis"""
+    
+    def __init__(self, output):
+        """
+        Initialize document
+        
+        Args:
+            output: Path file output atau file-like object
+        """
+        super().__init__(
+            output,
+            pagesize=A4,
+            leftMargin=10 * mm,
+            rightMargin=10 * mm,
+            topMargin=32 * mm,
+            bottomMargin=15 * mm,
+            title='Laporan Diagnosis Smartphone'
+        )
+    
+    @staticmethod
+    def _on_page(canvas, doc):
+        """Header dan footer untuk setiap halaman"""
+        width, height = doc.pagesize
+        canvas.saveState()
+        
+        # Header: digambar sekali per dokumen sebagai form, halaman
+        # berikutnya hanya mereferensikannya (tanpa setFont ulang)
+        if not canvas.hasForm(_HEADER_FORM):
+            canvas.beginForm(_HEADER_FORM)
+            canvas.setFont(*_HEADER_FONT)
+            canvas.drawCentredString(width / 2, height - 18 * mm, 'Laporan Diagnosis Smartphone')
+            canvas.setFont(*_SUBTITLE_FONT)
+            canvas.drawCentredString(width / 2, height - 24 * mm, 'Sistem Pakar Identifikasi Kerusakan')
+            canvas.endForm()
+        canvas.doForm(_HEADER_FORM)
+        
+        # Footer
+        canvas.setFont(*_FOOTER_FONT)
+        canvas.drawCentredString(width / 2, 8 * mm, f'Halaman {doc.page}')
+        
+        canvas.restoreState()
+    
+    def build_report(self, flowables: Iterator):
+        """Build PDF dari flowables"""
+        self.build(list(flowables), onFirstPage=self._on_page, onLaterPages=self._on_page)
+
+
+def title(text: str) -> Paragraph:
+    """Judul chapter"""
+    frags = _TITLE_FRAGS.get(text)
+    if frags is not None:
+        return Paragraph(text, _TITLE_STYLE, frags=frags)
+    return Paragraph(escape(text), _TITLE_STYLE)
+
+
+def body(text: str) -> Paragraph:
+    """Body chapter"""
+    return _paragraph(text, _BODY_STYLE)
+
+
+def spacer(height_mm: float) -> Spacer:
+    """Jarak vertikal (mm)"""
+    return Spacer(1, height_mm * mm)
+
+
+def page_break() -> PageBreak:
+    """Halaman baru"""
+    return PageBreak()
+
+
+def recommendation() -> Flowable:
+    """Halaman rekomendasi + disclaimer (statis)"""
+    return _FormFlowable(_RECOMMENDATION_FORM, [
+        Paragraph('REKOMENDASI', _TITLE_STYLE),
+        Paragraph(_RECOMMENDATION_MARKUP, _BODY_STYLE),
+        Spacer(1, 10 * mm),
+        Paragraph(_DISCLAIMER_MARKUP, _NOTE_STYLE)
+    ])
@@ -4,9 +4,113 @@ Validasi input untuk sistem pakar smartphone
 """
 
 import re
+from collections import namedtuple
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple
 import json
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback ke loop Python
+    np = None
+
+
+# Di bawah ukuran ini overhead konversi ke array lebih mahal dari loop
+_NUMPY_MIN_SIZE = 32
+
+# Pattern regex di-compile sekali saat import
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Tabel hapus-karakter-valid untuk rule/session ID (sisa != '' berarti invalid)
+_ALNUM_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+_RULE_SUFFIX_DELETE_TABLE = str.maketrans('', '', _ALNUM_CHARS + '_')
+_SESSION_ID_DELETE_TABLE = str.maketrans('', '', _ALNUM_CHARS + '_-')
+
+# Symptom ID: huruf kecil di awal, lalu huruf kecil/angka/underscore.
+# translate() dengan tabel ini menghapus semua karakter yang valid, jadi
+# sisa string yang tidak kosong berarti ada karakter tidak valid.
+_SYMPTOM_FIRST_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz')
+_SYMPTOM_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789_'
+_SYMPTOM_DELETE_TABLE = str.maketrans('', '', _SYMPTOM_CHARS)
+
+
+class _SymptomSanitizeTable(dict):
+    """
+    Tabel str.translate untuk sanitize_symptom_id: spasi jadi underscore,
+    karakter valid dipertahankan, karakter lain dihapus (di-cache saat
+    pertama kali ditemui)
+    """
+    
+    def __missing__(self, key: int):
+        self[key] = None
+        return None
+
+
+_SANITIZE_TRANS = _SymptomSanitizeTable({ord(c): ord(c) for c in _SYMPTOM_CHARS})
+_SANITIZE_TRANS[ord(' ')] = ord('_')
+
+
+def _clamp_cf(cf: float) -> float:
+    """Clamp CF float ke 0.0 - 1.0 (NaN menjadi 1.0)"""
+    if 0.0 <= cf <= 1.0:
+        return cf
+    return 0.0 if cf < 0.0 else 1.0
+
+
+def _scale_int_cf(cf: int) -> float:
+    """Skala integer 1-5 ke 0.2 - 1.0 (di luar rentang: default 0.5)"""
+    return cf / 5.0 if 1 <= cf <= 5 else 0.5
+
+
+@lru_cache(maxsize=4096)
+def _is_symptom_id(symptom_id: str) -> bool:
+    """True jika string memenuhi format symptom ID (hasil di-cache per ID)"""
+    return (bool(symptom_id)
+            and symptom_id[0] in _SYMPTOM_FIRST_CHARS
+            and not symptom_id.translate(_SYMPTOM_DELETE_TABLE))
+
+
+def _is_rule_id(rule_id: str) -> bool:
+    """True jika rule ID berformat R<angka> atau R<angka>_<suffix>"""
+    if rule_id[:1] != 'R':
+        return False
+    number, sep, suffix = rule_id[1:].partition('_')
+    return number.isdecimal() and (
+        not sep or (bool(suffix) and not suffix.translate(_RULE_SUFFIX_DELETE_TABLE))
+    )
+
+
+def _is_session_id(session_id: str) -> bool:
+    """True jika session ID hanya berisi huruf, angka, underscore, dan dash"""
+    return not session_id.translate(_SESSION_ID_DELETE_TABLE)
+
+
+def _format_ids(ids: List[Any]) -> str:
+    """Daftar ID untuk pesan error gabungan"""
+    return ', '.join(map(repr, ids))
+
+
+_MISSING = object()
+
+# Pesan error untuk batas default validate_symptoms_list (1..15)
+_ERR_TOO_FEW = 'Minimal 1 symptom harus dipilih'
+_ERR_TOO_MANY = 'Maksimal 15 symptoms dapat dipilih'
+
+# Struktur rule
+_REQUIRED_RULE_FIELDS = ('IF', 'THEN')
+_REQUIRED_RULE_KEYS = frozenset(_REQUIRED_RULE_FIELDS)
+
+# Struktur diagnosis
+_REQUIRED_DIAG_FIELDS = ('id', 'name', 'type', 'description')
+_REQUIRED_DIAG_KEYS = frozenset(_REQUIRED_DIAG_FIELDS)
+_DIAG_TYPES = ('hardware', 'software', 'hybrid')
+_VALID_DIAG_TYPES = frozenset(_DIAG_TYPES)
+_INVALID_DIAG_TYPE_MSG = f'Type harus salah satu dari: {", ".join(_DIAG_TYPES)}'
+_LIST_FIELDS = ('causes', 'solutions', 'prevention')
+
+# Record error ringan (tuple), dikonversi ke dict hanya di get_errors
+_ErrorRec = namedtuple('ErrorRec', 'field message')
+
 
 class ValidationError(Exception):
     """Custom exception untuk validation errors"""
@@ -18,11 +122,12 @@ class InputValidator:
     
     def __init__(self):
         """Initialize validator"""
-        self.errors = []
+        # List error baru dibuat saat error pertama ditambahkan
+        self.errors = None
         
     def reset_errors(self):
         """Reset error list"""
-        self.errors = []
+        self.errors = None
     
     def add_error(self, field: str, message: str):
         """
@@ -32,22 +137,21 @@ class InputValidator:
             field: Nama field yang error
             message: Pesan error
         """
-        self.errors.append({
-            'field': field,
-            'message': message
-        })
+        if self.errors is None:
+            self.errors = []
+        self.errors.append(_ErrorRec(field, message))
     
     def has_errors(self) -> bool:
         """Check apakah ada errors"""
-        return len(self.errors) > 0
+        return self.errors is not None and len(self.errors) > 0
     
     def get_errors(self) -> List[Dict]:
         """Get semua errors"""
-        return self.errors
+        return [{'field': err.field, 'message': err.message} for err in self.errors or ()]
     
     def get_error_messages(self) -> List[str]:
         """Get error messages saja"""
-        return [f"{err['field']}: {err['message']}" for err in self.errors]
+        return [f"{err.field}: {err.message}" for err in self.errors or ()]
     
     # Symptom Validation
     def validate_symptom_id(self, symptom_id: str) -> bool:
@@ -69,7 +173,7 @@ class InputValidator:
             return False
         
         # Check format (huruf kecil, underscore, angka)
-        if not re.match(r'^[a-z][a-z0-9_]*$', symptom_id):
+        if not _is_symptom_id(symptom_id):
             self.add_error('symptom_id', 
                           'Symptom ID harus huruf kecil, angka, dan underscore')
             return False
@@ -95,26 +199,35 @@ class InputValidator:
             self.add_error('symptoms', 'Symptoms harus berupa list')
             return False
         
-        if len(symptoms) < min_count:
-            self.add_error('symptoms', 
+        count = len(symptoms)
+        if count < min_count:
+            self.add_error('symptoms', _ERR_TOO_FEW if min_count == 1 else
                           f'Minimal {min_count} symptom harus dipilih')
             return False
         
-        if len(symptoms) > max_count:
-            self.add_error('symptoms', 
+        if count > max_count:
+            self.add_error('symptoms', _ERR_TOO_MANY if max_count == 15 else
                           f'Maksimal {max_count} symptoms dapat dipilih')
             return False
         
-        # Validate each symptom
+        # ID non-string (bisa unhashable) ditolak sebelum dedupe
         for symptom in symptoms:
-            if not self.validate_symptom_id(symptom):
-                return False
+            if not isinstance(symptom, str):
+                return self.validate_symptom_id(symptom)
         
         # Check duplicates
-        if len(symptoms) != len(set(symptoms)):
+        unique = dict.fromkeys(symptoms)
+        if len(symptoms) != len(unique):
             self.add_error('symptoms', 'Terdapat symptom duplikat')
             return False
         
+        # Validate semua ID unik sekaligus, satu error untuk semua yang salah
+        bad = [s for s in unique if not _is_symptom_id(s)]
+        if bad:
+            self.add_error('symptom_id',
+                          f'Symptom ID harus huruf kecil, angka, dan underscore: {_format_ids(bad)}')
+            return False
+        
         return True
     
     # Certainty Factor Validation
@@ -153,11 +266,32 @@ class InputValidator:
             self.add_error('cf_dict', 'CF dict harus berupa dictionary')
             return False
         
-        for symptom_id, cf in cf_dict.items():
-            if not self.validate_symptom_id(symptom_id):
-                return False
-            if not self.validate_cf(cf, 'user'):
-                return False
+        bad = [s for s in cf_dict if not (isinstance(s, str) and _is_symptom_id(s))]
+        if bad:
+            self.add_error('symptom_id',
+                          f'Symptom ID harus huruf kecil, angka, dan underscore: {_format_ids(bad)}')
+            return False
+        
+        values = cf_dict.values()
+        if not all(isinstance(cf, (int, float)) for cf in values):
+            self.add_error('cf', 'CF harus berupa angka')
+            return False
+        
+        # Range check sekaligus (NaN lolos, sama seperti validate_cf)
+        if np is not None and len(cf_dict) >= _NUMPY_MIN_SIZE:
+            try:
+                cfs = np.fromiter(values, dtype=np.float64, count=len(cf_dict))
+            except OverflowError:
+                # int di luar jangkauan float64 pasti di luar [0, 1]
+                out_of_range = True
+            else:
+                out_of_range = bool(np.logical_or(cfs < 0.0, cfs > 1.0).any())
+        else:
+            out_of_range = any(cf < 0.0 or cf > 1.0 for cf in values)
+        
+        if out_of_range:
+            self.add_error('cf', 'CF harus antara 0.0 dan 1.0')
+            return False
         
         return True
     
@@ -172,41 +306,46 @@ class InputValidator:
         Returns:
             True jika valid
         """
+        if not isinstance(rule, dict):
+            self.add_error('rule', 'Rule harus berupa dictionary')
+            return False
+        
         # Required fields
-        required_fields = ['IF', 'THEN']
+        missing = _REQUIRED_RULE_KEYS - rule.keys()
+        if missing:
+            field = next(f for f in _REQUIRED_RULE_FIELDS if f in missing)
+            self.add_error('rule', f'Field {field} wajib ada')
+            return False
         
-        for field in required_fields:
-            if field not in rule:
-                self.add_error('rule', f'Field {field} wajib ada')
-                return False
+        conditions = rule['IF']
+        conclusion = rule['THEN']
         
         # Validate IF (conditions)
-        if not isinstance(rule['IF'], list):
+        if not isinstance(conditions, list):
             self.add_error('rule', 'IF harus berupa list')
             return False
         
-        if len(rule['IF']) == 0:
+        if not conditions:
             self.add_error('rule', 'IF tidak boleh kosong')
             return False
         
-        for condition in rule['IF']:
-            if not isinstance(condition, str):
-                self.add_error('rule', 'Kondisi IF harus berupa string')
-                return False
+        if not all(isinstance(condition, str) for condition in conditions):
+            self.add_error('rule', 'Kondisi IF harus berupa string')
+            return False
         
         # Validate THEN (conclusion)
-        if not isinstance(rule['THEN'], str):
+        if not isinstance(conclusion, str):
             self.add_error('rule', 'THEN harus berupa string')
             return False
         
-        if not rule['THEN']:
+        if not conclusion:
             self.add_error('rule', 'THEN tidak boleh kosong')
             return False
         
         # Validate CF (optional)
-        if 'CF' in rule:
-            if not self.validate_cf(rule['CF'], 'rule'):
-                return False
+        cf = rule.get('CF', _MISSING)
+        if cf is not _MISSING and not self.validate_cf(cf, 'rule'):
+            return False
         
         return True
     
@@ -225,7 +364,7 @@ class InputValidator:
             return False
         
         # Format: R + angka atau R + angka + underscore + text
-        if not re.match(r'^R\d+(_[a-zA-Z0-9_]+)?$', rule_id):
+        if not _is_rule_id(rule_id):
             self.add_error('rule_id', 
                           'Rule ID harus format R<angka> (contoh: R1, R10)')
             return False
@@ -243,24 +382,26 @@ class InputValidator:
         Returns:
             True jika valid
         """
-        required_fields = ['id', 'name', 'type', 'description']
+        if not isinstance(diagnosis, dict):
+            self.add_error('diagnosis', 'Diagnosis harus berupa dictionary')
+            return False
         
-        for field in required_fields:
-            if field not in diagnosis:
-                self.add_error('diagnosis', f'Field {field} wajib ada')
-                return False
+        missing = _REQUIRED_DIAG_KEYS - diagnosis.keys()
+        if missing:
+            field = next(f for f in _REQUIRED_DIAG_FIELDS if f in missing)
+            self.add_error('diagnosis', f'Field {field} wajib ada')
+            return False
         
         # Validate type
-        valid_types = ['hardware', 'software', 'hybrid']
-        if diagnosis['type'] not in valid_types:
-            self.add_error('diagnosis', 
-                          f'Type harus salah satu dari: {", ".join(valid_types)}')
+        diag_type = diagnosis['type']
+        if not isinstance(diag_type, str) or diag_type not in _VALID_DIAG_TYPES:
+            self.add_error('diagnosis', _INVALID_DIAG_TYPE_MSG)
             return False
         
         # Validate lists
-        list_fields = ['causes', 'solutions', 'prevention']
-        for field in list_fields:
-            if field in diagnosis and not isinstance(diagnosis[field], list):
+        for field in _LIST_FIELDS:
+            value = diagnosis.get(field, _MISSING)
+            if value is not _MISSING and not isinstance(value, list):
                 self.add_error('diagnosis', f'{field} harus berupa list')
                 return False
         
@@ -278,8 +419,10 @@ class InputValidator:
             True jika valid
         """
         try:
+            # Parser sama dengan loader knowledge base (stdlib json, teks
+            # UTF-8): file yang lolos di sini pasti bisa di-load engine
             with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                json.load(f)
             return True
         except FileNotFoundError:
             self.add_error('json_file', f'File tidak ditemukan: {filepath}')
@@ -310,11 +453,19 @@ class InputValidator:
             self.add_error('rules', 'Key "rules" tidak ditemukan')
             return False
         
+        rule_map = rules['rules']
+        
+        # Validate semua rule ID sekaligus, satu error untuk semua yang salah
+        bad_ids = [rule_id for rule_id in rule_map if not _is_rule_id(rule_id)]
+        if bad_ids:
+            self.add_error('rule_id',
+                          f'Rule ID harus format R<angka> (contoh: R1, R10): {_format_ids(bad_ids)}')
+            return False
+        
         # Validate each rule
-        for rule_id, rule in rules['rules'].items():
-            if not self.validate_rule_id(rule_id):
-                return False
-            if not self.validate_rule_structure(rule):
+        validate_structure = self.validate_rule_structure
+        for rule in rule_map.values():
+            if not validate_structure(rule):
                 return False
         
         return True
@@ -365,7 +516,7 @@ class InputValidator:
             self.add_error(field_name, f'{field_name} harus berupa string')
             return False
         
-        if not value or value.strip() == '':
+        if not value or value.isspace():
             self.add_error(field_name, f'{field_name} tidak boleh kosong')
             return False
         
@@ -388,15 +539,21 @@ class InputValidator:
         Returns:
             True jika valid
         """
-        if not self.validate_non_empty_string(value, field_name):
+        if not isinstance(value, str):
+            self.add_error(field_name, f'{field_name} harus berupa string')
+            return False
+        
+        length = len(value)
+        if not length or value.isspace():
+            self.add_error(field_name, f'{field_name} tidak boleh kosong')
             return False
         
-        if len(value) < min_length:
+        if length < min_length:
             self.add_error(field_name, 
                           f'{field_name} minimal {min_length} karakter')
             return False
         
-        if len(value) > max_length:
+        if length > max_length:
             self.add_error(field_name, 
                           f'{field_name} maksimal {max_length} karakter')
             return False
@@ -419,7 +576,7 @@ class InputValidator:
             return False
         
         # Format: YYYYMMDD_HHMMSS atau similar
-        if not re.match(r'^[A-Za-z0-9_-]+$', session_id):
+        if not _is_session_id(session_id):
             self.add_error('session_id', 
                           'Session ID hanya boleh huruf, angka, underscore, dan dash')
             return False
@@ -427,74 +584,71 @@ class InputValidator:
         return True
 
 
-class DataSanitizer:
-    """Sanitizer untuk membersihkan input data"""
+# Sanitizer
+def sanitize_string(value: str) -> str:
+    """
+    Bersihkan string dari karakter berbahaya
     
-    @staticmethod
-    def sanitize_string(value: str) -> str:
-        """
-        Bersihkan string dari karakter berbahaya
-        
-        Args:
-            value: Input string
-            
-        Returns:
-            Cleaned string
-        """
-        if not isinstance(value, str):
-            return str(value)
+    Args:
+        value: Input string
         
-        # Remove leading/trailing whitespace
-        value = value.strip()
-        
-        # Remove multiple spaces
-        value = re.sub(r'\s+', ' ', value)
-        
-        return value
+    Returns:
+        Cleaned string
+    """
+    if not isinstance(value, str):
+        return str(value)
     
-    @staticmethod
-    def sanitize_symptom_id(symptom_id: str) -> str:
-        """
-        Bersihkan symptom ID
-        
-        Args:
-            symptom_id: Symptom ID
-            
-        Returns:
-            Cleaned symptom ID
-        """
-        # Convert to lowercase
-        symptom_id = symptom_id.lower()
-        
-        # Replace spaces with underscore
-        symptom_id = symptom_id.replace(' ', '_')
-        
-        # Remove non-alphanumeric except underscore
-        symptom_id = re.sub(r'[^a-z0-9_]', '', symptom_id)
-        
-        return symptom_id
+    # Remove leading/trailing whitespace
+    value = value.strip()
     
-    @staticmethod
-    def sanitize_cf(cf: Any) -> float:
-        """
-        Normalisasi CF value
-        
-        Args:
-            cf: CF value
-            
-        Returns:
-            Normalized CF (0.0 - 1.0)
-        """
-        if isinstance(cf, int):
-            # Assume 1-5 scale
-            if 1 <= cf <= 5:
-                return cf / 5.0
-        
-        if isinstance(cf, float):
-            # Clamp to 0-1
-            return max(0.0, min(1.0, cf))
+    # Remove multiple spaces
+    value = _WHITESPACE_RE.sub(' ', value)
+    
+    return value
+
+
+def sanitize_symptom_id(symptom_id: str) -> str:
+    """
+    Bersihkan symptom ID
+    
+    Args:
+        symptom_id: Symptom ID
+        
+    Returns:
+        Cleaned symptom ID
+    """
+    # Lowercase, lalu spasi -> underscore dan buang karakter lain
+    # dalam satu pass translate
+    return symptom_id.lower().translate(_SANITIZE_TRANS)
+
+
+def sanitize_cf(cf: Any) -> float:
+    """
+    Normalisasi CF value
+    
+    Args:
+        cf: CF value
         
-        return 0.5  # Default
+    Returns:
+        Normalized CF (0.0 - 1.0)
+    """
+    if isinstance(cf, int):
+        # Assume 1-5 scale
+        return _scale_int_cf(cf)
+    
+    if isinstance(cf, float):
+        # Clamp to 0-1
+        return _clamp_cf(cf)
+    
+    return 0.5  # Default
+
+
+class DataSanitizer:
+    """Sanitizer untuk membersihkan input data"""
+    
+    sanitize_string = staticmethod(sanitize_string)
+    sanitize_symptom_id = staticmethod(sanitize_symptom_id)
+    sanitize_cf = staticmethod(sanitize_cf)
 
 
 # Example usage